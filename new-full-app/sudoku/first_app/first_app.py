@@ -1,6 +1,12 @@
 import tkinter as tk
-import subprocess
 from tkinter import messagebox, Toplevel
+import os
+import sys
+
+# Make the shared sudoku_core package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sudoku_core import SolutionCache, SolveTask, empty_grid, find_problem, get_geometry, parse_cell
+from sudoku_ui import GRID_RENDERERS
 
 def center_window(window, width, height):
     # Get the screen width and height
@@ -14,224 +20,264 @@ def center_window(window, width, height):
     # Set the position of the window
     window.geometry(f'{width}x{height}+{x}+{y}')
 
-def restart_app():
-    # Restart the main script after closing the current window
-    root.destroy()  # Close the current window
-    subprocess.run(["python", "main.py"])
-
-# Initialize the main window
-root = tk.Tk()
-root.title("Sudoku : Chill Game!")
-root.configure(bg="#F4F5F7")  # Light grey background for a modern look
-
-width = 500
-height = 700
-
-# Center the window on the screen
-center_window(root, width, height)
-
 # Modern Colors and Fonts
 PRIMARY_COLOR = "#2D3748"  # Dark blue for text
 SECONDARY_COLOR = "#4A90E2"  # Accent blue
 BACKGROUND_COLOR = "#FFFFFF"  # White background
 GRID_COLOR = "#E2E8F0"  # Light border for grid
 HIGHLIGHT_COLOR = "#EDF2F7"  # Subtle highlight
+ERROR_COLOR = "#FFB3B3"  # Light red for cells that make the grid unsolvable
+
+# Background of every cell, alternating per box
+CELL_COLORS = tuple(tuple((BACKGROUND_COLOR, HIGHLIGHT_COLOR)[shade] for shade in row) for row in get_geometry(6).shade)
+
+SOLVER_ENGINE = "mrv"  # Any key of sudoku_core.SOLVERS, e.g. "backtracking"
+GRID_RENDERER = "entry"  # "entry" (one tk.Entry per cell) or "canvas" (the whole grid on one tk.Canvas)
+POLL_INTERVAL_MS = 16  # How often the window checks on a background solve (about 60 fps)
 
 FONT_TITLE = ("Segoe UI", 26, "bold")
 FONT_TEXT = ("Segoe UI", 12)
 FONT_ENTRY = ("Segoe UI", 18, "bold")
 
-# Create the Sudoku Grid
-def create_empty_grid():
-    return [[0 for _ in range(6)] for _ in range(6)]
-
-def is_valid_move(grid, row, col, num):
-    """Check if placing 'num' at grid[row][col] is valid."""
-    for i in range(6):
-        if grid[row][i] == num or grid[i][col] == num:
-            return False
-
-    box_row, box_col = row // 2 * 2, col // 3 * 3
-    for i in range(box_row, box_row + 2):
-        for j in range(box_col, box_col + 3):
-            if grid[i][j] == num:
-                return False
-    return True
-
-def solve_sudoku(grid):
-    """Solve the Sudoku grid using backtracking."""
-    for row in range(6):
-        for col in range(6):
-            if grid[row][col] == 0:
-                for num in range(1, 7):
-                    if is_valid_move(grid, row, col, num):
-                        grid[row][col] = num
-                        if solve_sudoku(grid):
-                            return True
-                        grid[row][col] = 0
-                return False
-    return True
-
 def validate_entry(value):
     """Ensure the entry contains only numbers from 0 to 6."""
-    return value == "" or (value.isdigit() and 0 <= int(value) <= 6)
-
-validate_command = root.register(validate_entry)
-
-# Premium Title Label
-title_label = tk.Label(
-    root,
-    text="6x6 Sudoku Solver",
-    font=FONT_TITLE,
-    bg="#F4F5F7",
-    fg=PRIMARY_COLOR
-)
-title_label.pack(pady=20)
-
-instructions_label = tk.Label(
-    root,
-    text="Enter numbers (1-6) in the grid and click 'Solve'.",
-    font=FONT_TEXT,
-    bg="#F4F5F7",
-    fg=PRIMARY_COLOR
-)
-instructions_label.pack()
-
-# Sudoku Grid
-entries = []
-grid = create_empty_grid()
-
-frame = tk.Frame(root, bg=GRID_COLOR, bd=2, relief="flat")
-frame.pack(pady=20)
-
-for i in range(6):
-    row_entries = []
-    for j in range(6):
-        bg_color = BACKGROUND_COLOR if (i // 2 + j // 3) % 2 == 0 else HIGHLIGHT_COLOR
-        entry = tk.Entry(
-            frame,
-            width=2,
+    return parse_cell(value) is not None
+
+class SolverScreen(tk.Frame):
+    """The "Make Machine Play" screen: the user enters a puzzle and the machine solves it."""
+
+    TITLE = "Sudoku : Chill Game!"
+    WIDTH = 500
+    HEIGHT = 750
+
+    def __init__(self, master):
+        super().__init__(master, bg="#F4F5F7")  # Light grey background for a modern look
+        self.puzzle = empty_grid()
+        self.solution_cache = SolutionCache()  # Solutions of puzzles solved this session
+        self.solve_task = None  # SolveTask running in the background, if any
+        self.poll_job = None  # Pending after() id of the next poll_solution
+        self.build()
+
+    def build(self):
+        """Create the widgets of the screen."""
+        # Premium Title Label
+        tk.Label(
+            self,
+            text="6x6 Sudoku Solver",
+            font=FONT_TITLE,
+            bg="#F4F5F7",
+            fg=PRIMARY_COLOR
+        ).pack(pady=20)
+
+        tk.Label(
+            self,
+            text="Enter numbers (1-6) in the grid and click 'Solve'.",
+            font=FONT_TEXT,
+            bg="#F4F5F7",
+            fg=PRIMARY_COLOR
+        ).pack()
+
+        # Sudoku Grid; the grid view sends only changed cells to Tk
+        self.grid_view = GRID_RENDERERS[GRID_RENDERER](
+            self,
+            CELL_COLORS,
             font=FONT_ENTRY,
-            justify="center",
-            bg=bg_color,
             fg=PRIMARY_COLOR,
+            grid_color=GRID_COLOR,
+            validate=validate_entry
+        )
+        self.grid_view.pack(pady=20)
+
+        # Solve Button with Hover Effect
+        self.solve_button = tk.Button(
+            self,
+            text="Solve",
+            command=self.display_solution,
+            font=("Segoe UI", 16, "bold"),
+            bg=PRIMARY_COLOR,
+            fg="white",
             relief="flat",
-            validate="key",
-            validatecommand=(validate_command, "%P")
+            padx=10,
+            pady=5
         )
-        entry.grid(row=i, column=j, ipadx=10, ipady=10, padx=2, pady=2)
-        row_entries.append(entry)
-    entries.append(row_entries)
-
-# Solve Functionality
-def display_solution():
-    """Solve and display the solution in the GUI."""
-    for row in range(6):
-        for col in range(6):
-            try:
-                grid[row][col] = int(entries[row][col].get()) if entries[row][col].get() else 0
-            except ValueError:
-                messagebox.showerror("Invalid Input", "Only numbers from 1-6 are allowed!")
-                return
-
-    if solve_sudoku(grid):
+        self.solve_button.bind("<Enter>", self.on_enter)
+        self.solve_button.bind("<Leave>", self.on_leave)
+        self.solve_button.pack(pady=10)
+
+        self.cancel_button = tk.Button(
+            self,
+            text="Cancel",
+            command=self.cancel_solution,
+            font=("Segoe UI", 12, "bold"),
+            bg=GRID_COLOR,
+            fg=PRIMARY_COLOR,
+            relief="flat",
+            state="disabled",
+            padx=10,
+            pady=2
+        )
+        self.cancel_button.pack(pady=(0, 10))
+
+        # Instructions Button
+        tk.Button(
+            self,
+            text="Instructions",
+            command=self.show_instructions,
+            font=("Segoe UI", 14, "bold"),
+            bg=SECONDARY_COLOR,
+            fg="white",
+            relief="flat",
+            padx=10,
+            pady=5
+        ).pack()
+
+        # Footer Label
+        tk.Label(
+            self,
+            text="Created by Batch B5",
+            font=("Segoe UI", 10, "italic"),
+            bg="#F4F5F7",
+            fg="#718096"
+        ).pack(pady=10)
+
+    def solve_sudoku(self, grid):
+        """Start solving a copy of the grid on a worker thread, reusing answers to equivalent puzzles."""
+        return SolveTask(grid, SOLVER_ENGINE, self.solution_cache).start()
+
+    # Solve Functionality
+    def display_solution(self):
+        """Solve and display the solution in the GUI."""
+        grid_view = self.grid_view
+        for row in range(6):
+            for col in range(6):
+                num = parse_cell(grid_view.get_text(row, col))
+                if num is None:
+                    messagebox.showerror("Invalid Input", "Only numbers from 1-6 are allowed!")
+                    return
+                self.puzzle[row][col] = num
+
+        # Reject grids that are provably unsolvable before starting a search
+        problem = find_problem(self.puzzle)
+        blamed = set(problem.cells) if problem is not None else ()
+        for row in range(6):
+            for col in range(6):
+                grid_view.set(row, col, bg=ERROR_COLOR if (row, col) in blamed else CELL_COLORS[row][col])
+        grid_view.flush()
+        if problem is not None:
+            messagebox.showerror("No Solution", f"This Sudoku puzzle cannot be solved. {problem.reason}")
+            return
+
+        self.solve_task = self.solve_sudoku(self.puzzle)
+        self.set_busy(True)
+        self.poll_job = self.after(POLL_INTERVAL_MS, self.poll_solution)
+
+    def poll_solution(self):
+        """Check on the background solve without blocking the window."""
+        self.poll_job = None
+        task = self.solve_task
+        if task is None:
+            return
+        if not task.done():
+            self.poll_job = self.after(POLL_INTERVAL_MS, self.poll_solution)
+            return
+
+        self.solve_task = None
+        self.set_busy(False)
+        if task.cancelled:
+            return
+        if task.error is not None:
+            messagebox.showerror("Solver Error", f"The solver failed: {task.error}")
+        elif task.solved:
+            for row in range(6):
+                self.puzzle[row][:] = task.grid[row]
+                for col in range(6):
+                    self.grid_view.set(row, col, text=self.puzzle[row][col], state="disabled",
+                                       disabledbackground=HIGHLIGHT_COLOR, disabledforeground=PRIMARY_COLOR)
+            self.grid_view.flush()
+
+            # Show success message and reset the game when OK is clicked
+            messagebox.showinfo("Success", "Sudoku solved successfully!")
+            self.reset_game()
+        else:
+            messagebox.showerror("No Solution", "This Sudoku puzzle cannot be solved.")
+
+    def cancel_solution(self):
+        """Stop the background solve; the grid stays as the user entered it."""
+        if self.solve_task is not None:
+            self.solve_task.cancel()
+
+    def set_busy(self, busy):
+        """Lock the grid and swap Solve for Cancel while a solve is running."""
+        for row in range(6):
+            for col in range(6):
+                self.grid_view.set(row, col, state="readonly" if busy else "normal")
+        self.grid_view.flush()
+        self.solve_button.config(state="disabled" if busy else "normal", text="Solving..." if busy else "Solve")
+        self.cancel_button.config(state="normal" if busy else "disabled")
+        self.winfo_toplevel().config(cursor="watch" if busy else "")
+
+    def reset_game(self):
+        """Reset the Sudoku grid and clear all entries."""
         for row in range(6):
             for col in range(6):
-                entries[row][col].delete(0, tk.END)
-                entries[row][col].insert(0, grid[row][col])
-                entries[row][col].config(state="disabled", disabledbackground=HIGHLIGHT_COLOR, disabledforeground=PRIMARY_COLOR)
-        
-        # Show success message and reset the game when OK is clicked
-        messagebox.showinfo("Success", "Sudoku solved successfully!")
-        reset_game()
-    else:
-        messagebox.showerror("No Solution", "This Sudoku puzzle cannot be solved.")
-
-def reset_game():
-    """Reset the Sudoku grid and clear all entries."""
-    for row in range(6):
-        for col in range(6):
-            entries[row][col].config(state="normal", bg=BACKGROUND_COLOR if (row // 2 + col // 3) % 2 == 0 else HIGHLIGHT_COLOR)
-            entries[row][col].delete(0, tk.END)
-            grid[row][col] = 0
-
-# Solve Button with Hover Effect
-def on_enter(e):
-    solve_button.config(bg=SECONDARY_COLOR, fg="white")
-
-def on_leave(e):
-    solve_button.config(bg=PRIMARY_COLOR, fg="white")
-
-solve_button = tk.Button(
-    root,
-    text="Solve",
-    command=display_solution,
-    font=("Segoe UI", 16, "bold"),
-    bg=PRIMARY_COLOR,
-    fg="white",
-    relief="flat",
-    padx=10,
-    pady=5
-)
-solve_button.bind("<Enter>", on_enter)
-solve_button.bind("<Leave>", on_leave)
-solve_button.pack(pady=10)
-
-# Instructions Button
-def show_instructions():
-    """Display Sudoku rules and instructions in a pop-up window."""
-    instructions_window = Toplevel(root)
-    instructions_window.title("Instructions")
-    instructions_window.geometry("500x400")
-    instructions_window.configure(bg="#F4F5F7")
-
-    instructions_text = (
-        "Welcome to the 6x6 Sudoku Solver!\n\n"
-        "Game Rules:\n"
-        "1. Each row must contain the numbers 1-6 without repetition.\n"
-        "2. Each column must contain the numbers 1-6 without repetition.\n"
-        "3. Each 2x3 sub-grid must also contain the numbers 1-6 without repetition.\n\n"
-        "How to Use:\n"
-        "1. Enter the known numbers (1-6) in the grid.\n"
-        "2. Leave empty cells blank or enter 0.\n"
-        "3. Click 'Solve' to find the solution.\n\n"
-        "Enjoy solving your puzzle!"
-    )
-
-    tk.Label(
-        instructions_window,
-        text=instructions_text,
-        font=FONT_TEXT,
-        justify="left",
-        wraplength=400,
-        bg="#F4F5F7",
-        fg=PRIMARY_COLOR
-    ).pack(padx=20, pady=20)
-
-instructions_button = tk.Button(
-    root,
-    text="Instructions",
-    command=show_instructions,
-    font=("Segoe UI", 14, "bold"),
-    bg=SECONDARY_COLOR,
-    fg="white",
-    relief="flat",
-    padx=10,
-    pady=5
-)
-instructions_button.pack()
-
-# Footer Label
-footer_label = tk.Label(
-    root,
-    text="Created by Batch B5",
-    font=("Segoe UI", 10, "italic"),
-    bg="#F4F5F7",
-    fg="#718096"
-)
-footer_label.pack(pady=10)
-
-# Bind the close button of the window to restart the app
-root.protocol("WM_DELETE_WINDOW", restart_app)
-
-root.mainloop()
\ No newline at end of file
+                self.grid_view.set(row, col, text="", state="normal", bg=CELL_COLORS[row][col])
+                self.puzzle[row][col] = 0
+        self.grid_view.flush()
+
+    def on_enter(self, e):
+        self.solve_button.config(bg=SECONDARY_COLOR, fg="white")
+
+    def on_leave(self, e):
+        self.solve_button.config(bg=PRIMARY_COLOR, fg="white")
+
+    # Instructions Button
+    def show_instructions(self):
+        """Display Sudoku rules and instructions in a pop-up window."""
+        instructions_window = Toplevel(self)
+        instructions_window.title("Instructions")
+        instructions_window.geometry("500x400")
+        instructions_window.configure(bg="#F4F5F7")
+
+        instructions_text = (
+            "Welcome to the 6x6 Sudoku Solver!\n\n"
+            "Game Rules:\n"
+            "1. Each row must contain the numbers 1-6 without repetition.\n"
+            "2. Each column must contain the numbers 1-6 without repetition.\n"
+            "3. Each 2x3 sub-grid must also contain the numbers 1-6 without repetition.\n\n"
+            "How to Use:\n"
+            "1. Enter the known numbers (1-6) in the grid.\n"
+            "2. Leave empty cells blank or enter 0.\n"
+            "3. Click 'Solve' to find the solution.\n\n"
+            "Enjoy solving your puzzle!"
+        )
+
+        tk.Label(
+            instructions_window,
+            text=instructions_text,
+            font=FONT_TEXT,
+            justify="left",
+            wraplength=400,
+            bg="#F4F5F7",
+            fg=PRIMARY_COLOR
+        ).pack(padx=20, pady=20)
+
+    def close(self):
+        """Stop background work before the screen is unmounted."""
+        self.cancel_solution()
+        self.solve_task = None
+        if self.poll_job is not None:
+            self.after_cancel(self.poll_job)  # It would fire after destroy()
+            self.poll_job = None
+        self.winfo_toplevel().config(cursor="")
+
+def main():
+    """Run this screen on its own, without the launcher."""
+    root = tk.Tk()
+    root.title(SolverScreen.TITLE)
+    root.configure(bg="#F4F5F7")
+    center_window(root, SolverScreen.WIDTH, SolverScreen.HEIGHT)
+    SolverScreen(root).pack(fill="both", expand=True)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
 import tkinter as tk
 from tkinter import messagebox
-import subprocess
 import sys
 
+from first_app.first_app import SolverScreen
+from second_app.second_app import PlayerScreen
+
+HOME_WIDTH = 600
+HOME_HEIGHT = 240
+HOME_TITLE = "Game of Sudoku"
+
+current_screen = None  # Screen frame mounted over the home page, if any
+
 def center_window(window, width, height):
     # Get the screen width and height
     screen_width = window.winfo_screenwidth()
@@ -15,29 +23,55 @@ def center_window(window, width, height):
     # Set the position of the window
     window.geometry(f'{width}x{height}+{x}+{y}')
 
+def show_screen(screen_class):
+    """Replace the home page with a screen, in the same window and process"""
+    global current_screen
+    home_frame.pack_forget()
+    current_screen = screen_class(root)
+    current_screen.pack(fill="both", expand=True)
+    root.title(screen_class.TITLE)
+    center_window(root, screen_class.WIDTH, screen_class.HEIGHT)
+
+def show_home():
+    """Unmount the current screen and bring the home page back"""
+    global current_screen
+    if current_screen is not None:
+        current_screen.close()
+        current_screen.destroy()
+        current_screen = None
+    home_frame.pack(fill="both", expand=True)
+    root.title(HOME_TITLE)
+    center_window(root, HOME_WIDTH, HOME_HEIGHT)
+
+def on_window_close():
+    """Closing the window goes back to the home page, or quits from the home page"""
+    if current_screen is not None:
+        show_home()
+    else:
+        root.destroy()
+
 def run_sudoku_app_part_1():
-    """Launch the second app (Sudoku solver) and close the current window"""
-    root.destroy()  # Close the current window
-    subprocess.run(["python", "first_app/first_app.py"])  # Run Sudoku app
+    """Open the first screen (Sudoku solver)"""
+    show_screen(SolverScreen)
 
 def run_sudoku_app_part_2():
-    """Launch the second app (Sudoku solver) and close the current window"""
-    root.destroy()  # Close the current window
-    subprocess.run(["python", "second_app/second_app.py"])  # Run Sudoku app
+    """Open the second screen (play as player)"""
+    show_screen(PlayerScreen)
 
 def main():
     """Main GUI with greeting message and options to play Sudoku or ask a question."""
     # Initialize the root window
-    global root
+    global root, home_frame
     root = tk.Tk()
-    root.title("Game of Sudoku")
+    root.title(HOME_TITLE)
     root.configure(bg="#F4F5F7")
 
-    width = 600
-    height = 240
-
     # Center the window on the screen
-    center_window(root, width, height)
+    center_window(root, HOME_WIDTH, HOME_HEIGHT)
+
+    # The home page is a frame, so screens can be swapped in and out of the same window
+    home_frame = tk.Frame(root, bg="#F4F5F7")
+    home_frame.pack(fill="both", expand=True)
     
     # Define fonts and colors
     PRIMARY_COLOR = "#2D3748"
@@ -46,7 +80,7 @@ def main():
     
     # Greeting Label
     greeting_label = tk.Label(
-        root,
+        home_frame,
         text="Welcome To the Game of Sudoku",
         font=FONT_TITLE,
         bg="#F4F5F7",
@@ -55,7 +89,7 @@ def main():
     greeting_label.pack(pady=30)
 
     # Create a frame to contain the buttons side by side
-    button_frame = tk.Frame(root, bg="#F4F5F7")
+    button_frame = tk.Frame(home_frame, bg="#F4F5F7")
     button_frame.pack(pady=20)
 
     # Button to make the machine play
@@ -100,6 +134,8 @@ def main():
     )
     exit_button.pack(side="left", padx=10)
 
+    # The window close button leaves a screen instead of quitting
+    root.protocol("WM_DELETE_WINDOW", on_window_close)
 
     # Run the main loop
     root.mainloop()
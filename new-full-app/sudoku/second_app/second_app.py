@@ -1,9 +1,12 @@
 import tkinter as tk
-import subprocess
 from tkinter import messagebox, Toplevel
-import random
-import copy
-import time
+import os
+import sys
+
+# Make the shared sudoku_core package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sudoku_core import ConflictTracker, GenerationTimeout, HintEngine, Stopwatch, empty_grid, format_time, get_geometry, make_puzzle, open_bank, parse_cell
+from sudoku_ui import GRID_RENDERERS
 
 def center_window(window, width, height):
     # Get the screen width and height
@@ -17,22 +20,6 @@ def center_window(window, width, height):
     # Set the position of the window
     window.geometry(f'{width}x{height}+{x}+{y}')
 
-def restart_app():
-    # Restart the main script after closing the current window
-    root.destroy()  # Close the current window
-    subprocess.run(["python", "main.py"])
-
-'''Initialize the main window'''
-root = tk.Tk()
-root.title("6x6 Sudoku: Solve it, Rock it!")
-root.configure(bg="#F4F5F7")
-
-width = 500
-height = 770
-
-# Center the window on the screen
-center_window(root, width, height)
-
 '''Colors and Fonts'''
 PRIMARY_COLOR = "#2D3748"  # Dark blue for text
 SECONDARY_COLOR = "#4A90E2"  # Accent blue
@@ -41,282 +28,243 @@ GRID_COLOR = "#E2E8F0"  # Light border for grid
 HIGHLIGHT_COLOR = "#EDF2F7"  # Subtle highlight
 ERROR_COLOR = "#FFB3B3"  # Light red for errors
 
+# Background of every cell, alternating per box
+CELL_COLORS = tuple(tuple((BACKGROUND_COLOR, HIGHLIGHT_COLOR)[shade] for shade in row) for row in get_geometry(6).shade)
+
+GRID_RENDERER = "entry"  # "entry" (one tk.Entry per cell) or "canvas" (the whole grid on one tk.Canvas)
+
 FONT_TITLE = ("Segoe UI", 26, "bold")
 FONT_TEXT = ("Segoe UI", 12)
 FONT_ENTRY = ("Segoe UI", 18, "bold")
 
-'''Heading Title'''
-title_label = tk.Label(root, text="6x6 Sudoku", font=FONT_TITLE, bg="#F4F5F7", fg=PRIMARY_COLOR)
-title_label.pack(pady=10)
-
-def create_empty_grid():
-    return [[0 for _ in range(6)] for _ in range(6)]
-
-'''Game grids and data'''
-grid = create_empty_grid()
-solved_grid = create_empty_grid()
-entries = []
-
-'''Timer variables'''
-start_time = None
-elapsed_time = 0
-timer_running = False
-
-'''Utility functions'''
-def is_valid_move(grid, row, col, num):
-    """Check if placing 'num' at grid[row][col] is valid."""
-    for i in range(6):
-        if grid[row][i] == num or grid[i][col] == num:
-            return False
-
-    box_row, box_col = row // 2 * 2, col // 3 * 3
-    for i in range(box_row, box_row + 2):
-        for j in range(box_col, box_col + 3):
-            if grid[i][j] == num:
-                return False
-    return True
-
-def solve_sudoku(grid):
-    """Solve the Sudoku grid using backtracking."""
-    for row in range(6):
-        for col in range(6):
-            if grid[row][col] == 0:
-                for num in range(1, 7):
-                    if is_valid_move(grid, row, col, num):
-                        grid[row][col] = num
-                        if solve_sudoku(grid):
-                            return True
-                        grid[row][col] = 0
-                return False
-    return True
-
-def copy_grid(original):
-    return [row[:] for row in original]
-
-def validate_grid(grid):
-    """Validate grid for rule violations."""
-    errors = []
-    for row in range(6):
-        for col in range(6):
-            num = grid[row][col]
-            if num != 0:
-                grid[row][col] = 0
-                if not is_valid_move(grid, row, col, num):
-                    errors.append((row, col))
-                grid[row][col] = num
-    return errors
-
-def highlight_errors(errors):
-    """Highlight cells that violate rules."""
-    for row in range(6):
-        for col in range(6):
-            bg_color = BACKGROUND_COLOR if (row // 2 + col // 3) % 2 == 0 else HIGHLIGHT_COLOR
-            if (row, col) in errors:
-                entries[row][col].config(bg=ERROR_COLOR)
-            else:
-                entries[row][col].config(bg=bg_color)
-
-def clear_errors():
-    """Clear any error highlights."""
-    for row in range(6):
-        for col in range(6):
-            bg_color = BACKGROUND_COLOR if (row // 2 + col // 3) % 2 == 0 else HIGHLIGHT_COLOR
-            entries[row][col].config(bg=bg_color)
-
-'''Hint System'''
-def provide_hint():
-    """Provide a hint by suggesting a correct placement."""
-    for row in range(6):
-        for col in range(6):
-            if grid[row][col] == 0:
-                for num in range(1, 7):
-                    if is_valid_move(grid, row, col, num):
-                        entries[row][col].delete(0, tk.END)
-                        entries[row][col].insert(0, num)
-                        return
-    messagebox.showinfo("No Hint", "No hints available.")
-
-'''Puzzle Generation'''
-def generate_puzzle(difficulty):
-    """Generate a random puzzle with specified difficulty."""
-    global grid, solved_grid
-    grid = create_empty_grid()
-    solve_sudoku(grid)  # Solve the grid first to generate a valid solution
-    solved_grid = copy_grid(grid)  # Keep a copy of the solved grid
-
-    # Set number of attempts based on difficulty
-    if difficulty == "Easy":
-        attempts = 18
-    elif difficulty == "Medium":
-        attempts = 27
-    elif difficulty == "Difficult":
-        attempts = 31
-    else:
-        attempts = 18  # Default to Easy if an invalid difficulty is provided
-
-    # Remove numbers to create the puzzle
-    while attempts > 0:
-        row, col = random.randint(0, 5), random.randint(0, 5)
-
-        # Skip cells that are already empty
-        while grid[row][col] == 0:
-            row, col = random.randint(0, 5), random.randint(0, 5)
-
-        # Remove the number from the grid (make the cell empty)
-        grid[row][col] = 0
-        attempts -= 1
-
-    display_puzzle(grid)  # Display the puzzle grid
-
-
-def display_puzzle(grid):
-    """Display the puzzle grid on the UI."""
-    clear_errors()  # Clear any previous error highlights
-    for row in range(6):
-        for col in range(6):
-            entries[row][col].config(state="normal")  # Make the cell editable
-            entries[row][col].delete(0, tk.END)  # Clear the current entry
-            if grid[row][col] != 0:
-                entries[row][col].insert(0, grid[row][col])  # Insert the pre-filled number
-                entries[row][col].config(state="disabled")  # Disable pre-filled cell
-            else:
-                entries[row][col].config(state="normal")  # Keep empty cells editable
-
-def show_solution():
-    """Display the solution to the puzzle."""
-    display_puzzle(solved_grid)
-    messagebox.showinfo("Solution", "Here is the solution to the puzzle.")
-
-def start_pause_reset_timer(action):
-    global start_time, elapsed_time, timer_running
-
-    if action == "start":
-        if not timer_running:
-            start_time = time.time() - elapsed_time
-            timer_running = True
-            update_timer()
-    elif action == "pause":
-        if timer_running:
-            elapsed_time = time.time() - start_time
-            timer_running = False
-    elif action == "reset":
-        elapsed_time = 0
-        start_time = None
-        timer_running = False
-        timer_label.config(text="Time: 00:00")
-
-def update_timer():
-    if timer_running:
-        elapsed_time = time.time() - start_time
-        formatted_time = format_time(elapsed_time)
-        timer_label.config(text=f"Time: {formatted_time}")
-        root.after(100, update_timer)
-
-def format_time(seconds):
-    minutes = int(seconds // 60)
-    seconds = int(seconds % 60)
-    return f"{minutes:02}:{seconds:02}"
-
-'''GUI Setup'''
-frame = tk.Frame(root, bg=GRID_COLOR, bd=2)
-frame.pack(pady=20)
-
-for i in range(6):
-    row_entries = []
-    for j in range(6):
-        bg_color = BACKGROUND_COLOR if (i // 2 + j // 3) % 2 == 0 else HIGHLIGHT_COLOR
-        entry = tk.Entry(frame, width=2, font=FONT_ENTRY, justify="center", bg=bg_color, relief="flat")
-        entry.grid(row=i, column=j, ipadx=10, ipady=10, padx=2, pady=2)
-        row_entries.append(entry)
-    entries.append(row_entries)
-
-'''Timer Label'''
-timer_label = tk.Label(root, text="Time: 00:00", font=FONT_TEXT, bg="#F4F5F7", fg=PRIMARY_COLOR)
-timer_label.pack(pady=10)
-
-'''Define the function to check for errors'''
-def check_for_errors():
-    for row in range(6):
-        for col in range(6):
-            grid[row][col] = int(entries[row][col].get()) if entries[row][col].get() else 0
-    errors = validate_grid(grid)
-    if errors:
-        highlight_errors(errors)
-        messagebox.showerror("Rule Violation", "There are errors in the grid. Please fix them.")
-    else:
-        clear_errors()
-        messagebox.showinfo("Valid Grid", "The grid is valid!")
-
-# Instructions Button
-def show_instructions():
-    """Display Sudoku rules and instructions in a pop-up window."""
-    instructions_window = Toplevel(root)
-    instructions_window.title("Instructions")
-    instructions_window.geometry("500x400")
-    instructions_window.configure(bg="#F4F5F7")
-
-    instructions_text = (
-        "Welcome to the 6x6 Sudoku Solver!\n\n"
-        "Game Rules:\n"
-        "1. Each row must contain the numbers 1-6 without repetition.\n"
-        "2. Each column must contain the numbers 1-6 without repetition.\n"
-        "3. Each 2x3 sub-grid must also contain the numbers 1-6 without repetition.\n\n"
-        "How to Use:\n"
-        "1. Enter the known numbers (1-6) in the grid.\n"
-        "2. Leave empty cells blank or enter 0.\n"
-        "3. Click 'Solve' to find the solution.\n\n"
-        "Enjoy solving your puzzle!"
-    )
-
-    tk.Label(
-        instructions_window,
-        text=instructions_text,
-        font=FONT_TEXT,
-        justify="left",
-        wraplength=400,
-        bg="#F4F5F7",
-        fg=PRIMARY_COLOR
-    ).pack(padx=20, pady=20)
-
-'''Buttons'''
-button_frame = tk.Frame(root, bg="#F4F5F7")
-button_frame.pack(pady=10)
-
-'''(Difficulty Selection)'''
-tk.Button(button_frame, text="Easy", command=lambda: generate_puzzle("Easy"), bg=PRIMARY_COLOR, fg="white", font=FONT_TEXT).grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-tk.Button(button_frame, text="Medium", command=lambda: generate_puzzle("Medium"), bg=PRIMARY_COLOR, fg="white", font=FONT_TEXT).grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-tk.Button(button_frame, text="Difficult", command=lambda: generate_puzzle("Difficult"), bg=PRIMARY_COLOR, fg="white", font=FONT_TEXT).grid(row=0, column=2, sticky="nsew", padx=5, pady=5)
-
-'''(Timer Options)'''
-tk.Button(button_frame, text="Strt/Rsm Timer", command=lambda: start_pause_reset_timer("start"), bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
-tk.Button(button_frame, text="Pause Timer", command=lambda: start_pause_reset_timer("pause"), bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
-tk.Button(button_frame, text="Reset Timer", command=lambda: start_pause_reset_timer("reset"), bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=1, column=2, sticky="nsew", padx=5, pady=5)
-
-'''(Gameplay Action Buttons)'''
-tk.Button(button_frame, text="Show Solution", command=show_solution, bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
-tk.Button(button_frame, text="Check Errors", command=check_for_errors, bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=2, column=1, sticky="nsew", padx=5, pady=5)
-tk.Button(button_frame, text="Hint", command=provide_hint, bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=2, column=2, sticky="nsew", padx=5, pady=5)
-
-tk.Button(button_frame, text="Instructions", command=show_instructions, bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=3, column=1, sticky="nsew", padx=5, pady=5)
-
-'''Makes rows and columns expandable'''
-for i in range(3):  # 3 rows of buttons
-    button_frame.grid_rowconfigure(i, weight=1)
-
-for i in range(3):  # 3 columns of buttons
-    button_frame.grid_columnconfigure(i, weight=1)
-
-# Footer Label
-footer_label = tk.Label(
-    root,
-    text="Created by Batch B5",
-    font=("Segoe UI", 10, "italic"),
-    bg="#F4F5F7",
-    fg="#718096"
-)
-footer_label.pack(pady=10)
-
-# Bind the close button of the window to restart the app
-root.protocol("WM_DELETE_WINDOW", restart_app)
-
-root.mainloop()
\ No newline at end of file
+puzzle_bank = open_bank()  # Memory-mapped puzzle bank, None if it has not been built
+
+class PlayerScreen(tk.Frame):
+    """The "Play as Player" screen: generated puzzles with hints, live error checks and a timer."""
+
+    TITLE = "6x6 Sudoku: Solve it, Rock it!"
+    WIDTH = 500
+    HEIGHT = 770
+
+    def __init__(self, master):
+        super().__init__(master, bg="#F4F5F7")
+
+        '''Game grids and data'''
+        self.puzzle = empty_grid()
+        self.solved_grid = empty_grid()
+        self.conflicts = ConflictTracker()  # Live rule violations of what is on screen
+        self.hints = HintEngine()  # Candidate cache of what is on screen
+
+        '''Timer variables'''
+        self.stopwatch = Stopwatch()  # Play time on the monotonic clock; elapsed() is the score time
+        self.timer_job = None  # Pending after() id of the next timer tick
+        self.timer_text = "Time: 00:00"  # What the timer label shows now
+
+        self.build()
+
+    def build(self):
+        """Create the widgets of the screen."""
+        '''Heading Title'''
+        tk.Label(self, text="6x6 Sudoku", font=FONT_TITLE, bg="#F4F5F7", fg=PRIMARY_COLOR).pack(pady=10)
+
+        '''GUI Setup'''
+        # The grid view sends only changed cells to Tk and calls on_cell_edit for every edit
+        self.grid_view = GRID_RENDERERS[GRID_RENDERER](self, CELL_COLORS, font=FONT_ENTRY, grid_color=GRID_COLOR, on_edit=self.on_cell_edit)
+        self.grid_view.pack(pady=20)
+
+        '''Timer Label'''
+        self.timer_label = tk.Label(self, text=self.timer_text, font=FONT_TEXT, bg="#F4F5F7", fg=PRIMARY_COLOR)
+        self.timer_label.pack(pady=10)
+
+        '''Hint Label'''
+        self.hint_label = tk.Label(self, text="", font=FONT_TEXT, bg="#F4F5F7", fg=PRIMARY_COLOR, wraplength=450)
+        self.hint_label.pack()
+
+        '''Buttons'''
+        button_frame = tk.Frame(self, bg="#F4F5F7")
+        button_frame.pack(pady=10)
+
+        '''(Difficulty Selection)'''
+        tk.Button(button_frame, text="Easy", command=lambda: self.generate_puzzle("Easy"), bg=PRIMARY_COLOR, fg="white", font=FONT_TEXT).grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        tk.Button(button_frame, text="Medium", command=lambda: self.generate_puzzle("Medium"), bg=PRIMARY_COLOR, fg="white", font=FONT_TEXT).grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
+        tk.Button(button_frame, text="Difficult", command=lambda: self.generate_puzzle("Difficult"), bg=PRIMARY_COLOR, fg="white", font=FONT_TEXT).grid(row=0, column=2, sticky="nsew", padx=5, pady=5)
+
+        '''(Timer Options)'''
+        tk.Button(button_frame, text="Strt/Rsm Timer", command=lambda: self.start_pause_reset_timer("start"), bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        tk.Button(button_frame, text="Pause Timer", command=lambda: self.start_pause_reset_timer("pause"), bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
+        tk.Button(button_frame, text="Reset Timer", command=lambda: self.start_pause_reset_timer("reset"), bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=1, column=2, sticky="nsew", padx=5, pady=5)
+
+        '''(Gameplay Action Buttons)'''
+        tk.Button(button_frame, text="Show Solution", command=self.show_solution, bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+        tk.Button(button_frame, text="Check Errors", command=self.check_for_errors, bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=2, column=1, sticky="nsew", padx=5, pady=5)
+        tk.Button(button_frame, text="Hint", command=self.provide_hint, bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=2, column=2, sticky="nsew", padx=5, pady=5)
+
+        tk.Button(button_frame, text="Instructions", command=self.show_instructions, bg=SECONDARY_COLOR, fg="white", font=FONT_TEXT).grid(row=3, column=1, sticky="nsew", padx=5, pady=5)
+
+        '''Makes rows and columns expandable'''
+        for i in range(3):  # 3 rows of buttons
+            button_frame.grid_rowconfigure(i, weight=1)
+
+        for i in range(3):  # 3 columns of buttons
+            button_frame.grid_columnconfigure(i, weight=1)
+
+        # Footer Label
+        tk.Label(
+            self,
+            text="Created by Batch B5",
+            font=("Segoe UI", 10, "italic"),
+            bg="#F4F5F7",
+            fg="#718096"
+        ).pack(pady=10)
+
+    def on_cell_edit(self, row, col):
+        """Feed an edited cell to the hint engine and conflict tracker, recolouring only cells that changed."""
+        num = parse_cell(self.grid_view.get_text(row, col)) or 0
+        self.hints.set_cell(row, col, num)
+        for r, c in self.conflicts.set_cell(row, col, num):
+            self.grid_view.set(r, c, bg=ERROR_COLOR if (r, c) in self.conflicts.conflicts else CELL_COLORS[r][c])
+        self.grid_view.flush()
+
+    '''Hint System'''
+    def provide_hint(self):
+        """Provide a hint by suggesting a correct placement, with the reason for it."""
+        hint = self.hints.next_hint(self.solved_grid)
+        if hint is None:
+            messagebox.showinfo("No Hint", "No hints available.")
+            return
+        self.grid_view.set(hint.row, hint.col, text=hint.num)
+        self.grid_view.flush()
+        self.hint_label.config(text=f"Hint: {hint.reason}")
+
+    '''Puzzle Generation'''
+    def generate_puzzle(self, difficulty):
+        """Generate a random puzzle with specified difficulty."""
+        # Draw from the pre-generated bank when it has puzzles of this difficulty
+        if puzzle_bank is not None and puzzle_bank.count(difficulty):
+            self.puzzle, self.solved_grid = puzzle_bank.draw(difficulty)
+        else:
+            # Live generation only hands back puzzles graded as asked, and
+            # gives up instead of mislabelling one when it runs out of time
+            try:
+                self.puzzle, self.solved_grid = make_puzzle(difficulty)
+            except GenerationTimeout:
+                messagebox.showerror("No Puzzle", f"Could not generate a {difficulty} puzzle in time. Please try again.")
+                return
+
+        self.display_puzzle(self.puzzle)  # Display the puzzle grid
+        self.hint_label.config(text="")
+
+    def display_puzzle(self, grid):
+        """Display the puzzle grid on the UI."""
+        # Load the trackers with the new grid first: the text writes below
+        # then find nothing to change in on_cell_edit, instead of colouring
+        # conflicts between the old and the new puzzle half way through.
+        self.conflicts = ConflictTracker(grid)
+        self.hints = HintEngine(grid)
+
+        # Pre-filled cells are disabled, empty ones stay editable; error highlights are cleared.
+        # Only the cells that differ from what is on screen are sent to Tk.
+        conflicts = self.conflicts.conflicts
+        for row in range(6):
+            for col in range(6):
+                num = grid[row][col]
+                bg_color = ERROR_COLOR if (row, col) in conflicts else CELL_COLORS[row][col]
+                self.grid_view.set(row, col, text=num or "", state="disabled" if num else "normal", bg=bg_color)
+        self.grid_view.flush()
+
+    def show_solution(self):
+        """Display the solution to the puzzle."""
+        self.display_puzzle(self.solved_grid)
+        messagebox.showinfo("Solution", "Here is the solution to the puzzle.")
+
+    def start_pause_reset_timer(self, action):
+        if action == "start":
+            if not self.stopwatch.running:
+                self.stopwatch.resume()
+                self.update_timer()
+        elif action == "pause":
+            if self.stopwatch.running:
+                self.stopwatch.pause()
+                self.cancel_timer_tick()
+                self.show_time()
+        elif action == "reset":
+            self.stopwatch.reset()
+            self.cancel_timer_tick()
+            self.show_time()
+
+    def update_timer(self):
+        """Show the time and wake up again when the shown second changes, not before."""
+        self.timer_job = None
+        if self.stopwatch.running:
+            self.show_time()
+            # One extra millisecond so the tick lands just after the second boundary
+            delay = int(self.stopwatch.until_next_second() * 1000) + 1
+            self.timer_job = self.after(delay, self.update_timer)
+
+    def cancel_timer_tick(self):
+        if self.timer_job is not None:
+            self.after_cancel(self.timer_job)
+            self.timer_job = None
+
+    def show_time(self):
+        """Update the timer label, skipping the Tk call when the text would not change."""
+        text = f"Time: {format_time(self.stopwatch.elapsed())}"
+        if text != self.timer_text:
+            self.timer_text = text
+            self.timer_label.config(text=text)
+
+    '''Define the function to check for errors'''
+    def check_for_errors(self):
+        # Conflicts are tracked and highlighted as the player types, so only report them
+        if self.conflicts.conflicts:
+            messagebox.showerror("Rule Violation", "There are errors in the grid. Please fix them.")
+        else:
+            messagebox.showinfo("Valid Grid", "The grid is valid!")
+
+    # Instructions Button
+    def show_instructions(self):
+        """Display Sudoku rules and instructions in a pop-up window."""
+        instructions_window = Toplevel(self)
+        instructions_window.title("Instructions")
+        instructions_window.geometry("500x400")
+        instructions_window.configure(bg="#F4F5F7")
+
+        instructions_text = (
+            "Welcome to the 6x6 Sudoku Solver!\n\n"
+            "Game Rules:\n"
+            "1. Each row must contain the numbers 1-6 without repetition.\n"
+            "2. Each column must contain the numbers 1-6 without repetition.\n"
+            "3. Each 2x3 sub-grid must also contain the numbers 1-6 without repetition.\n\n"
+            "How to Use:\n"
+            "1. Enter the known numbers (1-6) in the grid.\n"
+            "2. Leave empty cells blank or enter 0.\n"
+            "3. Click 'Solve' to find the solution.\n\n"
+            "Enjoy solving your puzzle!"
+        )
+
+        tk.Label(
+            instructions_window,
+            text=instructions_text,
+            font=FONT_TEXT,
+            justify="left",
+            wraplength=400,
+            bg="#F4F5F7",
+            fg=PRIMARY_COLOR
+        ).pack(padx=20, pady=20)
+
+    def close(self):
+        """Stop the timer loop before the screen is unmounted."""
+        self.stopwatch.pause()
+        self.cancel_timer_tick()
+
+def main():
+    """Run this screen on its own, without the launcher."""
+    root = tk.Tk()
+    root.title(PlayerScreen.TITLE)
+    root.configure(bg="#F4F5F7")
+    center_window(root, PlayerScreen.WIDTH, PlayerScreen.HEIGHT)
+    PlayerScreen(root).pack(fill="both", expand=True)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+'''Shared Sudoku logic used by the Tk front ends'''
+
+from .analysis import GridProblem, find_problem
+from .background import SolveTask
+from .batch import solve_many
+from .board import Board
+from .board_state import BoardState, digits_in
+from .canonical import SolutionCache, apply_transform, canonical_form, invert_transform, solve_cached
+from .conflicts import ConflictTracker
+from .dlx import ExactCover, candidate_id, iter_solutions, solve_dlx
+from .errors import GenerationTimeout, SolveCancelled
+from .geometry import BOX_SHAPES, Geometry, geometry_for, get_geometry
+from .grid import copy_grid, empty_grid, format_time, parse_cell, validate_grid
+from .generator import DEFAULT_BUDGET, REMOVALS, REMOVALS_BY_SIZE, SEED_GRIDS, dig_puzzle, generate_solution, generate_solutions, make_puzzle, random_solution
+from .grader import DIFFICULTY_RANKS, DIFFICULTY_RANKS_BY_SIZE, TECHNIQUES, Grade, difficulty_ranks, grade_puzzle, matches_difficulty
+from .hints import Hint, HintEngine, unit_name
+from .propagation import propagate
+from .puzzle_bank import DIFFICULTIES, PuzzleBank, open_bank
+from .solvers import DEFAULT_ENGINE, SOLVERS, SolveStats, count_solutions, solve, solve_backtracking, solve_mrv
+from .stopwatch import Stopwatch
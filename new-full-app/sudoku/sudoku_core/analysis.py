@@ -0,0 +1,62 @@
+'''Quick checks that prove a grid unsolvable before any search runs
+
+Three cheap tests catch most impossible inputs:
+
+    - two givens repeat a digit in a row, column or box
+    - an empty cell has no candidate left
+    - a row, column or box has a digit with nowhere left to go
+
+Each runs over the precomputed unit tables once, so a rejected grid costs
+microseconds instead of a search of the whole tree.
+'''
+
+from .board_state import BoardState
+from .hints import unit_name
+
+
+class GridProblem:
+    """Why a grid cannot be solved and which cells are to blame."""
+
+    __slots__ = ("reason", "cells")
+
+    def __init__(self, reason, cells):
+        self.reason = reason  # Human-readable explanation
+        self.cells = cells  # (row, col) cells to highlight
+
+    def __repr__(self):
+        return f"GridProblem({self.reason!r}, {self.cells!r})"
+
+
+def find_problem(grid):
+    """Return a GridProblem when the grid is provably unsolvable, else None.
+
+    None does not promise a solution; it only means none of the quick
+    checks failed and a solver has to decide.
+    """
+    state = BoardState(grid)
+    conflicts = state.conflicts()
+    if conflicts:
+        return GridProblem("Some numbers repeat in a row, column or box.", conflicts)
+
+    geometry = state.geometry
+    size = geometry.size
+    cands = [[0] * size for _ in range(size)]
+    for row in range(size):
+        for col in range(size):
+            if grid[row][col] == 0:
+                mask = state.candidates(row, col)
+                if mask == 0:
+                    return GridProblem(f"Row {row + 1}, column {col + 1} has no number left that fits.", [(row, col)])
+                cands[row][col] = mask
+
+    for unit, cells in enumerate(geometry.units):
+        places = 0
+        for row, col in cells:
+            num = grid[row][col]
+            places |= (1 << num) if num else cands[row][col]
+        missing = state.all_digits & ~places
+        if missing:
+            num = (missing & -missing).bit_length() - 1
+            empty = [(row, col) for row, col in cells if grid[row][col] == 0]
+            return GridProblem(f"{num} has no place left in {unit_name(geometry, unit)}.", empty)
+    return None
@@ -0,0 +1,57 @@
+'''Background solving for the Tk front ends
+
+Tk is single threaded, so a long search inside a button callback freezes
+the window. A SolveTask runs the search on a worker thread against its own
+copy of the grid; the UI starts it, polls done() from root.after and can
+stop it at any time with cancel().
+'''
+
+from .canonical import solve_cached
+from .errors import SolveCancelled
+from .solvers import DEFAULT_ENGINE, solve
+
+
+class SolveTask:
+    """One solve running on a daemon thread."""
+
+    def __init__(self, grid, engine=DEFAULT_ENGINE, cache=None):
+        self.grid = [row[:] for row in grid]  # Worker copy; the caller's grid is never touched
+        self.engine = engine
+        self.cache = cache
+        self.solved = False
+        self.cancelled = False
+        self.error = None  # Exception raised by the solver, if any
+
+        # Imported here so that headless users of sudoku_core do not pay for threading
+        import threading
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        try:
+            if self.cache is not None:
+                self.solved = solve_cached(self.grid, self.cache, self.engine, cancel=self._cancel)
+            else:
+                self.solved = solve(self.grid, self.engine, cancel=self._cancel)
+        except SolveCancelled:
+            self.cancelled = True
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self._done.set()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Ask the search to stop; it does so at its next node."""
+        self._cancel.set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Block until the task finishes; returns done()."""
+        return self._done.wait(timeout)
@@ -0,0 +1,68 @@
+'''Offline builder for the puzzle bank
+
+Usage (from the directory holding sudoku_core):
+
+    python -m sudoku_core.bank_builder --count 1000 --seed 1
+'''
+
+import argparse
+import random
+
+from .board import Board
+from .generator import make_puzzle
+from .grader import grade_puzzle, matches_difficulty
+from .puzzle_bank import DEFAULT_BANK_PATH, DIFFICULTIES, write_bank
+from .solvers import count_solutions, solve
+
+
+def verify_puzzle(puzzle, solution, difficulty):
+    """Check that the puzzle is unique, solves to 'solution' and grades as 'difficulty'.
+
+    Returns the grade, or None when the puzzle fails a check.
+    """
+    if count_solutions(puzzle) != 1:
+        return None
+    solved = [row[:] for row in puzzle]
+    if not solve(solved) or solved != solution:
+        return None
+    grade = grade_puzzle(puzzle)
+    return grade if matches_difficulty(grade, difficulty) else None
+
+
+def build_puzzles(count, seed=None):
+    """Return {difficulty: [(rank, puzzle, solution), ...]} with 'count' distinct verified puzzles each."""
+    rng = random.Random(seed)
+    puzzles = {}
+    for difficulty in DIFFICULTIES:
+        seen = set()
+        puzzles[difficulty] = []
+        while len(puzzles[difficulty]) < count:
+            # No time budget: make_puzzle digs until a candidate grades as asked
+            puzzle, solution = make_puzzle(difficulty, rng, budget=None)
+            key = Board.from_grid(puzzle)
+            if key in seen:
+                continue
+            grade = verify_puzzle(puzzle, solution, difficulty)
+            if grade is None:
+                continue
+            seen.add(key)
+            puzzles[difficulty].append((grade.rank, puzzle, solution))
+    return puzzles
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the pre-generated puzzle bank.")
+    parser.add_argument("--count", type=int, default=1000, help="puzzles per difficulty")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for a reproducible bank")
+    parser.add_argument("--output", default=DEFAULT_BANK_PATH, help="bank file to write")
+    args = parser.parse_args(argv)
+
+    puzzles = build_puzzles(args.count, args.seed)
+    write_bank(args.output, puzzles)
+    for difficulty in DIFFICULTIES:
+        print(f"{difficulty}: {len(puzzles[difficulty])} puzzles")
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+'''Headless bulk solving across worker processes'''
+
+import os
+from collections import deque
+from itertools import islice
+
+from .solvers import DEFAULT_ENGINE, solve
+
+
+def _solve_chunk(start, grids, engine):
+    # Runs in a worker: returns (index, solution or None) for each grid of the chunk
+    results = []
+    for offset, grid in enumerate(grids):
+        results.append((start + offset, grid if solve(grid, engine) else None))
+    return results
+
+
+def _chunks(grids, chunk_size):
+    iterator = iter(grids)
+    start = 0
+    while True:
+        chunk = [[list(row) for row in grid] for grid in islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def solve_many(grids, workers=None, engine=DEFAULT_ENGINE, chunk_size=64, ordered=True):
+    """Solve an iterable of grids on a process pool.
+
+    Yields (index, solution) pairs, where 'index' is the position of the
+    grid in the input and 'solution' is None for unsolvable grids. With
+    ordered=True the pairs come in input order, otherwise as soon as
+    their chunk finishes. The input grids are never modified.
+
+    Grids are sent to the workers 'chunk_size' at a time, and only a few
+    chunks per worker are in flight, so the input can be a lazy stream.
+    """
+    # Imported here: concurrent.futures pulls in multiprocessing, which
+    # would otherwise make every "import sudoku_core" tens of ms slower
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    chunks = _chunks(grids, chunk_size)
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    def submit_next():
+        item = next(chunks, None)
+        if item is None:
+            return None
+        start, chunk = item
+        return executor.submit(_solve_chunk, start, chunk, engine)
+
+    try:
+        if ordered:
+            pending = deque()
+            while True:
+                while len(pending) < max_pending:
+                    future = submit_next()
+                    if future is None:
+                        break
+                    pending.append(future)
+                if not pending:
+                    return
+                yield from pending.popleft().result()
+        else:
+            pending = set()
+            while True:
+                while len(pending) < max_pending:
+                    future = submit_next()
+                    if future is None:
+                        break
+                    pending.add(future)
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+    finally:
+        # Drop queued chunks if the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
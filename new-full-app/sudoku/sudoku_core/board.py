@@ -0,0 +1,89 @@
+'''Compact flat board stored in one bytearray
+
+A Board keeps the N*N cells of a grid in row-major order, one byte per
+cell, so a 6x6 board is a 36-byte buffer instead of seven lists. It is
+meant for storing many boards (caches, banks, seen-sets); the solvers
+and the Tk code keep working on list-of-lists grids, and from_grid() and
+to_grid() convert between the two.
+'''
+
+from .geometry import get_geometry
+
+# Characters used by to_string(); from_string() also reads "." as empty
+DIGIT_CHARS = "0123456789ABCDEFG"
+
+
+class Board:
+    """A size x size grid in a flat bytearray; cell = row * size + col.
+
+    Boards hash by their cells, so a Board used as a set member or dict
+    key must not be changed afterwards.
+    """
+
+    __slots__ = ("size", "cells")
+
+    def __init__(self, size=6, cells=None):
+        get_geometry(size)  # Rejects unsupported sizes
+        if cells is None:
+            cells = bytearray(size * size)
+        elif len(cells) != size * size:
+            raise ValueError(f"A {size}x{size} board needs {size * size} cells, got {len(cells)}")
+        self.size = size
+        self.cells = bytearray(cells)
+
+    @classmethod
+    def from_grid(cls, grid):
+        """Build a Board from a list-of-lists grid."""
+        return cls(len(grid), bytearray(num for row in grid for num in row))
+
+    def to_grid(self):
+        """Return the board as a new list-of-lists grid."""
+        size, cells = self.size, self.cells
+        return [list(cells[start:start + size]) for start in range(0, size * size, size)]
+
+    @classmethod
+    def from_string(cls, text):
+        """Parse a row-major string such as the one to_string() returns."""
+        size = int(len(text) ** 0.5)
+        if size * size != len(text):
+            raise ValueError(f"Board strings must hold a square number of cells, got {len(text)}")
+        try:
+            cells = bytearray(0 if char == "." else DIGIT_CHARS.index(char.upper()) for char in text)
+        except ValueError:
+            raise ValueError(f"Invalid character in board string {text!r}") from None
+        if max(cells, default=0) > size:
+            raise ValueError(f"Board string {text!r} has digits above {size}")
+        return cls(size, cells)
+
+    def to_string(self):
+        """Return the cells as one row-major string, 0 for empty cells."""
+        return "".join(DIGIT_CHARS[num] for num in self.cells)
+
+    def get(self, row, col):
+        return self.cells[row * self.size + col]
+
+    def set(self, row, col, num):
+        self.cells[row * self.size + col] = num
+
+    def copy(self):
+        """Return an independent Board; the cells are copied in one go."""
+        board = Board.__new__(Board)
+        board.size = self.size
+        board.cells = self.cells[:]
+        return board
+
+    def empty_count(self):
+        """Return the number of empty cells."""
+        return self.cells.count(0)
+
+    def __eq__(self, other):
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.cells == other.cells
+
+    def __hash__(self):
+        # The size is implied by the number of cells
+        return hash(bytes(self.cells))
+
+    def __repr__(self):
+        return f"Board.from_string({self.to_string()!r})"
@@ -0,0 +1,98 @@
+'''Bitmask board state shared by the solver, validator and hint code'''
+
+from .geometry import geometry_for
+
+
+class BoardState:
+    """Row, column and box occupancy of an N x N grid kept as integer bitmasks.
+
+    Digit `n` is stored as bit `1 << n`. The state wraps the caller's
+    grid, so place() and unplace() write through to it while keeping the
+    masks in sync in O(1).
+    """
+
+    __slots__ = ("grid", "geometry", "box_of", "all_digits", "rows", "cols", "boxes", "duplicates")
+
+    def __init__(self, grid, geometry=None):
+        if geometry is None:
+            geometry = geometry_for(grid)
+        size = geometry.size
+        box_of = geometry.box_of
+        self.grid = grid
+        self.geometry = geometry
+        self.box_of = box_of
+        self.all_digits = geometry.all_digits
+        self.rows = [0] * size
+        self.cols = [0] * size
+        self.boxes = [0] * size
+        # Digits seen more than once in a unit: [row dups, col dups, box dups].
+        # Filled in here only; place() and unplace() leave it alone.
+        self.duplicates = [[0] * size, [0] * size, [0] * size]
+
+        for row in range(size):
+            for col in range(size):
+                num = grid[row][col]
+                if num != 0:
+                    bit = 1 << num
+                    box = box_of[row][col]
+                    self.duplicates[0][row] |= self.rows[row] & bit
+                    self.duplicates[1][col] |= self.cols[col] & bit
+                    self.duplicates[2][box] |= self.boxes[box] & bit
+                    self.rows[row] |= bit
+                    self.cols[col] |= bit
+                    self.boxes[box] |= bit
+
+    def candidates(self, row, col):
+        """Return the bitmask of digits that can legally go in grid[row][col]."""
+        return self.all_digits & ~(self.rows[row] | self.cols[col] | self.boxes[self.box_of[row][col]])
+
+    def is_valid_move(self, row, col, num):
+        """Check if placing 'num' at grid[row][col] is valid."""
+        return not (self.rows[row] | self.cols[col] | self.boxes[self.box_of[row][col]]) & (1 << num)
+
+    def place(self, row, col, num):
+        """Write 'num' into an empty cell and mark it in the masks."""
+        bit = 1 << num
+        self.grid[row][col] = num
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[self.box_of[row][col]] |= bit
+
+    def unplace(self, row, col):
+        """Clear a cell that was filled with place()."""
+        mask = ~(1 << self.grid[row][col])
+        self.grid[row][col] = 0
+        self.rows[row] &= mask
+        self.cols[col] &= mask
+        self.boxes[self.box_of[row][col]] &= mask
+
+    def has_duplicates(self):
+        """Check if the grid repeated a digit in some unit when the state was built."""
+        return any(any(dups) for dups in self.duplicates)
+
+    def conflicts(self):
+        """Return the (row, col) cells whose digit repeats in a row, column or box.
+
+        The repeats are the ones found when the state was built; place()
+        and unplace() do not update them, so build a new BoardState to
+        check a grid that has changed since.
+        """
+        row_dups, col_dups, box_dups = self.duplicates
+        errors = []
+        size = self.geometry.size
+        for row in range(size):
+            for col in range(size):
+                num = self.grid[row][col]
+                if num != 0:
+                    bit = 1 << num
+                    if (row_dups[row] | col_dups[col] | box_dups[self.box_of[row][col]]) & bit:
+                        errors.append((row, col))
+        return errors
+
+
+def digits_in(mask):
+    """Yield the digits set in a candidate bitmask, smallest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
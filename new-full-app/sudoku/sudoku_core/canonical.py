@@ -0,0 +1,174 @@
+'''Canonical forms of 6x6 puzzles and a solution cache keyed by them
+
+Two puzzles are equivalent when one turns into the other by the
+validity-preserving transforms the generator uses:
+
+    - row swaps inside each 2-row band, and band swaps (48 row orders)
+    - column swaps inside each 3-column stack, and stack swaps (72 orders)
+    - digit relabeling
+
+Transposition is not one of them: it would turn the 2x3 boxes into 3x2
+boxes. The canonical form is the smallest row-major cell string over all
+3456 row/column orders, with digits relabeled 1, 2, 3... in order of
+first appearance, so relabeling never has to be searched.
+'''
+
+from collections import OrderedDict
+
+from .board import Board
+from .generator import COL_ORDERS
+from .solvers import DEFAULT_ENGINE, solve
+
+
+def _relabel(line, cols, labels, next_label, cells):
+    # Append the relabeled cells of one row to 'cells'; returns the next free label
+    for col in cols:
+        num = line[col]
+        if num:
+            label = labels[num]
+            if not label:
+                label = labels[num] = next_label
+                next_label += 1
+            cells.append(label)
+        else:
+            cells.append(0)
+    return next_label
+
+
+def canonical_form(grid):
+    """Return (key, transform) for a 6x6 grid.
+
+    'key' is the canonical cell string as bytes. 'transform' is
+    (rows, cols, labels) such that the canonical grid is
+    labels[grid[rows[r]][cols[c]]] for every r, c.
+    """
+    # Build the canonical string one row at a time. Every partial
+    # transform (rows so far, column order, labels) that ties for the
+    # smallest prefix is kept, all the others are dropped, so most of
+    # the 3456 row/column orders are never finished.
+    states = [((), cols, [0] * 7, 1) for cols in COL_ORDERS]
+    for position in range(6):
+        best = None
+        survivors = []
+        for rows, cols, labels, next_label in states:
+            if position % 2:
+                choices = (rows[-1] ^ 1,)  # The other row of the band just started
+            else:
+                choices = [row for row in range(6) if row not in rows]  # Any row of an unused band
+            for row in choices:
+                cells = []
+                new_labels = labels[:]
+                new_next = _relabel(grid[row], cols, new_labels, next_label, cells)
+                if best is None or cells < best:
+                    best = cells
+                    survivors = [(rows + (row,), cols, new_labels, new_next)]
+                elif cells == best:
+                    survivors.append((rows + (row,), cols, new_labels, new_next))
+        states = survivors
+
+    rows, cols, labels, _ = states[0]
+    # Digits missing from the puzzle take the leftover labels in order
+    unused = iter(label for label in range(1, 7) if label not in labels)
+    labels = tuple(label or next(unused) if num else 0 for num, label in enumerate(labels))
+    transform = (rows, cols, labels)
+    return bytes(num for line in apply_transform(grid, transform) for num in line), transform
+
+
+def apply_transform(grid, transform):
+    """Return the grid moved into canonical position by 'transform'."""
+    rows, cols, labels = transform
+    return [[labels[grid[row][col]] for col in cols] for row in rows]
+
+
+def invert_transform(grid, transform):
+    """Undo apply_transform(): map a canonical grid back to the original position."""
+    rows, cols, labels = transform
+    digits = [0] * len(labels)
+    for num, label in enumerate(labels):
+        digits[label] = num
+    original = [[0] * 6 for _ in range(6)]
+    for line, row in zip(grid, rows):
+        target = original[row]
+        for num, col in zip(line, cols):
+            target[col] = digits[num]
+    return original
+
+
+class SolutionCache:
+    """Bounded LRU cache of puzzle -> solution.
+
+    Each solved puzzle is stored twice: under its exact cells, so asking
+    again for the same puzzle is one dict lookup, and under its canonical
+    form, so any relabeled or permuted copy of it is a hit too. Solutions
+    are kept as compact Boards.
+
+    'maxsize' counts puzzles: the cache holds up to twice as many entries,
+    one per key.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize  # Puzzles kept; the entry limit is 2 * maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # puzzle cells (bytes) -> solution Board
+        self._last_form = None  # (exact key, canonical key, transform) of the last miss
+
+    def __len__(self):
+        """Return the number of entries (keys), at most 2 * maxsize."""
+        return len(self._entries)
+
+    def _lookup(self, key):
+        board = self._entries.get(key)
+        if board is not None:
+            self._entries.move_to_end(key)
+        return board
+
+    def _store(self, key, board):
+        self._entries[key] = board
+        self._entries.move_to_end(key)
+        while len(self._entries) > 2 * self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _canonical_form(self, key, grid):
+        # A miss is usually followed by put() for the same puzzle, so keep its form
+        if self._last_form is None or self._last_form[0] != key:
+            self._last_form = (key, *canonical_form(grid))
+        return self._last_form[1:]
+
+    def get(self, grid):
+        """Return a solution grid of 'grid' from the cache, or None on a miss."""
+        key = bytes(Board.from_grid(grid).cells)
+        board = self._lookup(key)
+        if board is None and len(grid) == 6:
+            canonical_key, transform = self._canonical_form(key, grid)
+            board = self._lookup(canonical_key)
+            if board is not None:
+                board = Board.from_grid(invert_transform(board.to_grid(), transform))
+                self._store(key, board)
+        if board is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return board.to_grid()
+
+    def put(self, grid, solution):
+        """Remember 'solution' for the puzzle 'grid'."""
+        key = bytes(Board.from_grid(grid).cells)
+        self._store(key, Board.from_grid(solution))
+        if len(grid) == 6:
+            canonical_key, transform = self._canonical_form(key, grid)
+            self._store(canonical_key, Board.from_grid(apply_transform(solution, transform)))
+
+
+def solve_cached(grid, cache, engine=DEFAULT_ENGINE, cancel=None):
+    """Solve the grid in place like solve(), answering from 'cache' when possible."""
+    solution = cache.get(grid)
+    if solution is None:
+        puzzle = [row[:] for row in grid]
+        if not solve(grid, engine, cancel=cancel):
+            return False
+        cache.put(puzzle, grid)
+        return True
+    for row, line in zip(grid, solution):
+        row[:] = line
+    return True
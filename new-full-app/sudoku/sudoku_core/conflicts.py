@@ -0,0 +1,65 @@
+'''Incremental conflict tracking for live error highlighting'''
+
+from .geometry import DEFAULT, geometry_for
+
+
+class ConflictTracker:
+    """Keeps per-unit digit counts of a grid and the set of conflicting cells.
+
+    set_cell() only looks at the row, column and box of the edited cell,
+    so each edit costs the same no matter how full the grid is.
+    """
+
+    __slots__ = ("geometry", "grid", "counts", "conflicts")
+
+    def __init__(self, grid=None, geometry=None):
+        if geometry is None:
+            geometry = DEFAULT if grid is None else geometry_for(grid)
+        size = geometry.size
+        self.geometry = geometry
+        self.grid = geometry.empty_grid()
+        self.counts = [[0] * (size + 1) for _ in geometry.units]  # counts[unit][num]
+        self.conflicts = set()  # (row, col) cells whose digit repeats in a unit
+        if grid is not None:
+            for row in range(size):
+                for col in range(size):
+                    self.set_cell(row, col, grid[row][col])
+
+    def _in_conflict(self, row, col):
+        num = self.grid[row][col]
+        if num == 0:
+            return False
+        counts = self.counts
+        return any(counts[unit][num] > 1 for unit in self.geometry.cell_units[row][col])
+
+    def set_cell(self, row, col, num):
+        """Write 'num' (0 for empty) into a cell; return the cells whose conflict state flipped."""
+        grid = self.grid
+        old = grid[row][col]
+        if old == num:
+            return []
+
+        units = self.geometry.cell_units[row][col]
+        for unit in units:
+            counts = self.counts[unit]
+            if old:
+                counts[old] -= 1
+            if num:
+                counts[num] += 1
+        grid[row][col] = num
+
+        # Only cells holding the old or the new digit can change state
+        changed = []
+        for unit in units:
+            for cell in self.geometry.units[unit]:
+                value = grid[cell[0]][cell[1]]
+                if value != old and value != num and cell != (row, col):
+                    continue
+                if self._in_conflict(*cell):
+                    if cell not in self.conflicts:
+                        self.conflicts.add(cell)
+                        changed.append(cell)
+                elif cell in self.conflicts:
+                    self.conflicts.discard(cell)
+                    changed.append(cell)
+        return changed
@@ -0,0 +1,226 @@
+'''Dancing Links (Algorithm X) exact-cover solver for N x N grids
+
+The puzzle is an exact-cover problem with one matrix row per candidate
+(N*N cells x N digits) and 4*N*N constraint columns, in four blocks of
+N*N:
+
+    cell (row, col) holds a digit
+    row 'row' holds digit 'num'
+    column 'col' holds digit 'num'
+    box 'box' holds digit 'num'
+
+For a 6x6 grid that is 216 rows and 144 columns. The linked matrix is
+built once per geometry. Each search copies the flat link arrays, covers
+the givens and runs Knuth's Algorithm X.
+'''
+
+from .errors import SolveCancelled
+from .geometry import geometry_for
+
+ROOT = 0
+
+
+def candidate_id(row, col, num, size=6):
+    """Return the matrix row for placing 'num' at grid[row][col] of a size x size grid."""
+    return (row * size + col) * size + num - 1
+
+
+class _Matrix:
+    # Flat link arrays of the full, uncovered matrix for one geometry
+    __slots__ = ("left", "right", "up", "down", "column", "size", "candidate", "first_node")
+
+    def __init__(self, geometry):
+        n = geometry.size
+        columns = 4 * n * n
+
+        # Node 0 is the root, nodes 1..columns are column headers, then 4 nodes per candidate
+        left = [0] * (columns + 1)
+        right = [0] * (columns + 1)
+        up = list(range(columns + 1))
+        down = list(range(columns + 1))
+        column = list(range(columns + 1))
+        size = [0] * (columns + 1)
+        candidate = [-1] * (columns + 1)
+        for node in range(columns + 1):
+            left[node] = node - 1 if node > 0 else columns
+            right[node] = node + 1 if node < columns else 0
+
+        first_node = []
+        for row in range(n):
+            for col in range(n):
+                box = geometry.box_of[row][col]
+                for digit in range(n):
+                    headers = (
+                        1 + row * n + col,
+                        1 + n * n + row * n + digit,
+                        1 + 2 * n * n + col * n + digit,
+                        1 + 3 * n * n + box * n + digit,
+                    )
+                    start = len(left)
+                    first_node.append(start)
+                    for offset, header in enumerate(headers):
+                        node = start + offset
+                        # Horizontal ring of the four nodes of this candidate
+                        left.append(start + (offset - 1) % 4)
+                        right.append(start + (offset + 1) % 4)
+                        # Append at the bottom of the column
+                        up.append(up[header])
+                        down.append(header)
+                        down[up[header]] = node
+                        up[header] = node
+                        column.append(header)
+                        candidate.append(len(first_node) - 1)
+                        size[header] += 1
+
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.column = column
+        self.size = size
+        self.candidate = candidate
+        self.first_node = first_node
+
+
+_MATRICES = {}
+
+
+def _matrix_for(geometry):
+    matrix = _MATRICES.get(geometry.size)
+    if matrix is None:
+        matrix = _MATRICES[geometry.size] = _Matrix(geometry)
+    return matrix
+
+
+class ExactCover:
+    """One search over the shared matrix, with the givens of 'grid' already covered."""
+
+    __slots__ = ("left", "right", "up", "down", "size", "column", "candidate", "consistent", "cancel")
+
+    def __init__(self, grid, geometry=None, cancel=None):
+        if geometry is None:
+            geometry = geometry_for(grid)
+        matrix = _matrix_for(geometry)
+        self.left = matrix.left[:]
+        self.right = matrix.right[:]
+        self.up = matrix.up[:]
+        self.down = matrix.down[:]
+        self.size = matrix.size[:]
+        self.column = matrix.column
+        self.candidate = matrix.candidate
+        self.consistent = True
+        self.cancel = cancel  # Optional threading.Event checked at every node
+
+        right = self.right
+        column = self.column
+        n = geometry.size
+        for row in range(n):
+            for col in range(n):
+                num = grid[row][col]
+                if num == 0:
+                    continue
+                node = matrix.first_node[candidate_id(row, col, num, n)]
+                for _ in range(4):
+                    header = column[node]
+                    if right[self.left[header]] != header:
+                        # Two givens share a constraint, nothing can be solved
+                        self.consistent = False
+                        return
+                    self._cover(header)
+                    node = right[node]
+
+    def _cover(self, header):
+        left, right, up, down, size, column = self.left, self.right, self.up, self.down, self.size, self.column
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        row_node = down[header]
+        while row_node != header:
+            node = right[row_node]
+            while node != row_node:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                size[column[node]] -= 1
+                node = right[node]
+            row_node = down[row_node]
+
+    def _uncover(self, header):
+        left, right, up, down, size, column = self.left, self.right, self.up, self.down, self.size, self.column
+        row_node = up[header]
+        while row_node != header:
+            node = left[row_node]
+            while node != row_node:
+                size[column[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row_node = up[row_node]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def search(self, chosen=None):
+        """Yield the list of chosen candidate ids for every solution."""
+        if not self.consistent:
+            return
+        if self.cancel is not None and self.cancel.is_set():
+            raise SolveCancelled
+        if chosen is None:
+            chosen = []
+        right, down, size, column = self.right, self.down, self.size, self.column
+
+        header = right[ROOT]
+        if header == ROOT:
+            yield chosen
+            return
+
+        # Branch on the constraint with the fewest remaining options
+        best = header
+        while header != ROOT:
+            if size[header] < size[best]:
+                best = header
+                if size[best] == 0:
+                    return
+            header = right[header]
+        if size[best] == 0:
+            return
+
+        self._cover(best)
+        row_node = down[best]
+        while row_node != best:
+            chosen.append(self.candidate[row_node])
+            node = right[row_node]
+            while node != row_node:
+                self._cover(column[node])
+                node = right[node]
+
+            yield from self.search(chosen)
+
+            node = self.left[row_node]
+            while node != row_node:
+                self._uncover(column[node])
+                node = self.left[node]
+            chosen.pop()
+            row_node = down[row_node]
+        self._uncover(best)
+
+
+def _apply(grid, chosen):
+    n = len(grid)
+    for cand in chosen:
+        cell, digit = divmod(cand, n)
+        grid[cell // n][cell % n] = digit + 1
+
+
+def iter_solutions(grid):
+    """Yield every solution of the grid as a new grid, leaving 'grid' untouched."""
+    for chosen in ExactCover(grid).search():
+        solution = [row[:] for row in grid]
+        _apply(solution, chosen)
+        yield solution
+
+
+def solve_dlx(grid, cancel=None):
+    """Solve the Sudoku grid in place using Dancing Links."""
+    for chosen in ExactCover(grid, cancel=cancel).search():
+        _apply(grid, chosen)
+        return True
+    return False
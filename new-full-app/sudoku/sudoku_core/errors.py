@@ -0,0 +1,9 @@
+'''Exceptions shared by the solver and generator modules'''
+
+
+class SolveCancelled(Exception):
+    """Raised out of a search when its cancel event is set."""
+
+
+class GenerationTimeout(Exception):
+    """Raised by make_puzzle when no puzzle grades as asked within its time budget."""
@@ -0,0 +1,243 @@
+'''Random solved-grid and puzzle generator
+
+Instead of running a solver on an empty grid, a solution is made by
+taking one of 49 seed grids, one for each class of equivalent 6x6
+solutions, and applying random validity-preserving transforms:
+
+    - digit relabeling (a random order of 1..6)
+    - row swaps inside each 2-row band, and band swaps
+    - column swaps inside each 3-column stack, and stack swaps
+
+No search is involved, so a grid costs a few dozen list operations.
+The 6x6 transforms are precomputed; other sizes start from a pattern
+grid and shuffle bands, stacks and labels on the fly.
+Puzzles are then dug out of a solution one uniqueness-checked removal
+at a time. Candidates are dug until the grader agrees with the
+difficulty; if that takes longer than the time budget, GenerationTimeout
+is raised rather than handing back a puzzle with the wrong label.
+'''
+
+import random
+import time
+from itertools import accumulate, permutations, product
+
+from .board_state import BoardState, digits_in
+from .errors import GenerationTimeout
+from .geometry import DEFAULT, get_geometry
+from .grader import grade_puzzle, matches_difficulty
+from .solvers import solve
+
+'''Seed grids: one per class of 6x6 solutions under the transforms below'''
+# (canonical 36-digit row-major string, weight). A class's weight is its
+# number of grids divided by 48 * 720, so drawing a seed by weight and then
+# a uniformly random transform gives every valid 6x6 grid the same chance.
+_SEEDS = (
+    ("123456456132214365635241361524542613", 72),
+    ("123456456123214365365241532614641532", 36),
+    ("123456456123214365365241541632632514", 36),
+    ("123456456123214635635241341562562314", 36),
+    ("123456456123214635635241362514541362", 36),
+    ("123456456123234561561342342615615234", 36),
+    ("123456456132214365635214362541541623", 36),
+    ("123456456132214563635214341625562341", 36),
+    ("123456456132215364364521542613631245", 36),
+    ("123456456132215643364215542361631524", 36),
+    ("123456456132215643364521531264642315", 36),
+    ("123456456132235641641523364215512364", 36),
+    ("123456456123214365365214532641641532", 18),
+    ("123456456123214365635241362514541632", 18),
+    ("123456456123214635365241541362632514", 18),
+    ("123456456123214635635214342561561342", 18),
+    ("123456456132214563635241342615561324", 18),
+    ("123456456132215364634521342615561243", 18),
+    ("123456456132215643634215342561561324", 18),
+    ("123456456132231564564213345621612345", 18),
+    ("123456456132231564564321342615615243", 18),
+    ("123456456132231564645213314625562341", 18),
+    ("123456456132231564645321364215512643", 18),
+    ("123456456231214563365124531642642315", 18),
+    ("123456456123231564564312312645645231", 12),
+    ("123456456123214365365214531642642531", 9),
+    ("123456456123231564564231315642642315", 9),
+    ("123456456123231645564312315264642531", 9),
+    ("123456456123231645645231314562562314", 9),
+    ("123456456123234561615342342615561234", 9),
+    ("123456456123214635635214341562562341", 6),
+    ("123456456123234615561342315264642531", 6),
+    ("123456456132214563635241341625562314", 6),
+    ("123456456132215364634521361245542613", 6),
+    ("123456456132215643634215361524542361", 6),
+    ("123456456132231564564213312645645321", 6),
+    ("123456456132231564564321312645645213", 6),
+    ("123456456132231564645213312645564321", 6),
+    ("123456456132231564645321312645564213", 6),
+    ("123456456123214365365214541632632541", 3),
+    ("123456456123231564645312312645564231", 3),
+    ("123456456123234561561234315642642315", 3),
+    ("123456456123234561561234345612612345", 3),
+    ("123456456231231564564312312645645123", 2),
+    ("123456456231231645564123312564645312", 2),
+    ("123456456231231645645312312564564123", 2),
+    ("123456456123231564564231312645645312", 1),
+    ("123456456123231645564312312564645231", 1),
+    ("123456456123231645645231312564564312", 1),
+)
+SEED_GRIDS = tuple(
+    tuple(tuple(int(digit) for digit in text[row * 6:row * 6 + 6]) for row in range(6))
+    for text, _ in _SEEDS
+)
+SEED_WEIGHTS = tuple(weight for _, weight in _SEEDS)
+_SEED_CUM_WEIGHTS = tuple(accumulate(SEED_WEIGHTS))
+
+# The strings are canonical forms (see canonical.py), so equal classes would
+# show up as equal strings; the weights must cover all 28,200,960 grids.
+if len({text for text, _ in _SEEDS}) != len(_SEEDS) or _SEED_CUM_WEIGHTS[-1] * 48 * 720 != 28200960:
+    raise ImportError("SEED_GRIDS must hold every 6x6 solution class exactly once")
+
+
+def _line_orders(groups, group_size):
+    # Every order of the groups combined with every order inside each group
+    orders = []
+    for group_order in permutations(range(groups)):
+        for inner in product(*(permutations(range(group * group_size, (group + 1) * group_size))
+                               for group in group_order)):
+            orders.append(tuple(line for part in inner for line in part))
+    return tuple(orders)
+
+
+'''Every transform is precomputed once, so drawing one is a single choice()'''
+ROW_ORDERS = _line_orders(3, 2)  # 48 orders
+COL_ORDERS = _line_orders(2, 3)  # 72 orders
+LABELINGS = tuple((0, *labels) for labels in permutations(range(1, 7)))  # 720 relabelings
+
+
+def _shuffled_lines(rng, groups, group_size):
+    # One random line order: shuffle the groups, then the lines inside each
+    order = list(range(groups))
+    rng.shuffle(order)
+    lines = []
+    for group in order:
+        inner = list(range(group * group_size, (group + 1) * group_size))
+        rng.shuffle(inner)
+        lines.extend(inner)
+    return lines
+
+
+def _pattern_solution(rng, geometry):
+    size, box_rows, box_cols = geometry.size, geometry.box_rows, geometry.box_cols
+    labels = list(range(1, size + 1))
+    rng.shuffle(labels)
+    rows = _shuffled_lines(rng, size // box_rows, box_rows)
+    cols = _shuffled_lines(rng, size // box_cols, box_cols)
+    # Shifted-row pattern grid, which is valid for any box shape
+    return [
+        [labels[(box_cols * (row % box_rows) + row // box_rows + col) % size] for col in cols]
+        for row in rows
+    ]
+
+
+def random_solution(rng, geometry=DEFAULT):
+    """Return a new solved grid drawn with the given random.Random."""
+    if geometry.size != 6:
+        return _pattern_solution(rng, geometry)
+    choice = rng.choice
+    seed_grid = rng.choices(SEED_GRIDS, cum_weights=_SEED_CUM_WEIGHTS)[0]
+    labels = choice(LABELINGS)
+    cols = choice(COL_ORDERS)
+    return [[labels[line[col]] for col in cols] for line in map(seed_grid.__getitem__, choice(ROW_ORDERS))]
+
+
+def generate_solution(seed=None, size=6):
+    """Return a random solved grid. The same 'seed' always gives the same grid."""
+    return random_solution(random.Random(seed), get_geometry(size))
+
+
+def generate_solutions(count, seed=None, size=6):
+    """Yield 'count' random solved grids from one reproducible stream."""
+    rng = random.Random(seed)
+    geometry = get_geometry(size)
+    for _ in range(count):
+        yield random_solution(rng, geometry)
+
+
+'''Puzzle generation'''
+# Number of cells to remove for each difficulty on a 6x6 grid. A unique 6x6
+# puzzle rarely loses more than 26 cells, so 36 means "as many as can go":
+# only such minimal puzzles now and then need more than hidden singles.
+REMOVALS = {
+    "Easy": 18,
+    "Medium": 36,
+    "Difficult": 36,
+}
+
+# The same for every size. Large sparse grids mostly need guessing and get
+# slow to check for uniqueness, so the share removed drops as they grow.
+REMOVALS_BY_SIZE = {
+    4: {"Easy": 8, "Medium": 10, "Difficult": 11},
+    6: REMOVALS,
+    8: {"Easy": 32, "Medium": 44, "Difficult": 48},
+    9: {"Easy": 40, "Medium": 56, "Difficult": 60},
+    12: {"Easy": 72, "Medium": 86, "Difficult": 93},
+    16: {"Easy": 102, "Medium": 128, "Difficult": 140},
+}
+
+# Seconds make_puzzle() may spend digging before it gives up. About 1 in 100
+# minimal 6x6 puzzles is Medium and 1 in 200 Difficult, at about 3 ms a
+# candidate, so a draw usually takes well under a second.
+DEFAULT_BUDGET = 5.0
+
+
+def _only_value(grid, row, col, num):
+    # True when no solution of the grid puts anything but 'num' at (row, col).
+    # The grid was unique with 'num' in place, so this is a uniqueness check.
+    for other in digits_in(BoardState(grid).candidates(row, col)):
+        if other == num:
+            continue
+        trial = [line[:] for line in grid]
+        trial[row][col] = other
+        if solve(trial):
+            return False
+    return True
+
+
+def dig_puzzle(solution, removals, rng=random):
+    """Remove up to 'removals' cells from the solution while keeping it unique."""
+    grid = [row[:] for row in solution]
+
+    # Remove numbers to create the puzzle, visiting every cell once in random order
+    size = len(grid)
+    cells = [(row, col) for row in range(size) for col in range(size)]
+    rng.shuffle(cells)
+    for row, col in cells:
+        if removals == 0:
+            break
+
+        # Remove the number, but put it back if the puzzle stops being unique
+        num = grid[row][col]
+        grid[row][col] = 0
+        if _only_value(grid, row, col, num):
+            removals -= 1
+        else:
+            grid[row][col] = num
+    return grid
+
+
+def make_puzzle(difficulty, rng=random, size=6, budget=DEFAULT_BUDGET):
+    """Return (puzzle, solution) for the difficulty, with a unique solution.
+
+    Candidates are dug until the grader agrees with the label. When
+    'budget' seconds pass first, GenerationTimeout is raised; pass
+    budget=None to keep digging for as long as it takes.
+    """
+    if difficulty not in REMOVALS:
+        difficulty = "Easy"  # Default to Easy if an invalid difficulty is provided
+    geometry = get_geometry(size)
+    removals = REMOVALS_BY_SIZE[size][difficulty]
+    deadline = None if budget is None else time.monotonic() + budget
+    while True:
+        solution = random_solution(rng, geometry)
+        grid = dig_puzzle(solution, removals, rng)
+        if matches_difficulty(grade_puzzle(grid), difficulty, size):
+            return grid, solution
+        if deadline is not None and time.monotonic() >= deadline:
+            raise GenerationTimeout(f"No {difficulty} {size}x{size} puzzle found within {budget} seconds")
@@ -0,0 +1,118 @@
+'''Generator throughput and quality benchmark
+
+Usage (from the directory holding sudoku_core):
+
+    python -m sudoku_core.generator_benchmark --count 20 --output generators.json
+
+Every generator in GENERATORS makes 'count' puzzles per difficulty for
+each seed of a fixed seed set, so two runs of the same version produce
+the same puzzles. For each generator and difficulty the JSON report holds
+puzzles per second, the fraction of puzzles with a unique solution, the
+fraction the grader agrees with, and the clue-count and grade
+distributions. Only generation is timed; the checks run afterwards.
+'''
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from collections import Counter
+
+from .generator import REMOVALS, dig_puzzle, make_puzzle, random_solution
+from .geometry import DEFAULT
+from .grader import TECHNIQUES, grade_puzzle, matches_difficulty
+from .solvers import count_solutions
+
+DEFAULT_SEEDS = (0, 1, 2, 3, 4)
+
+
+def dig_only(difficulty, rng):
+    """Return a puzzle dug for the difficulty's removal count, without asking the grader."""
+    return dig_puzzle(random_solution(rng, DEFAULT), REMOVALS[difficulty], rng)
+
+
+def graded(difficulty, rng):
+    """Return a puzzle from make_puzzle(), which digs until the grader agrees (the app's generator)."""
+    return make_puzzle(difficulty, rng, budget=None)[0]
+
+
+'''Generators by name; each takes (difficulty, random.Random) and returns a puzzle grid'''
+GENERATORS = {
+    "graded": graded,
+    "dig": dig_only,
+}
+
+
+def bench_difficulty(generator, difficulty, count=20, seeds=DEFAULT_SEEDS):
+    """Benchmark one generator on one difficulty; returns the report entry as a dict."""
+    puzzles = []
+    elapsed = 0.0
+    for seed in seeds:
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        for _ in range(count):
+            puzzles.append(generator(difficulty, rng))
+        elapsed += time.perf_counter() - start
+
+    clues = Counter(sum(1 for row in puzzle for num in row if num) for puzzle in puzzles)
+    grades = [grade_puzzle(puzzle) for puzzle in puzzles]
+    unique = sum(1 for puzzle in puzzles if count_solutions(puzzle) == 1)
+    agreed = sum(1 for grade in grades if matches_difficulty(grade, difficulty))
+    techniques = Counter(grade.technique for grade in grades)
+    return {
+        "puzzles": len(puzzles),
+        "seconds": round(elapsed, 4),
+        "puzzles_per_sec": round(len(puzzles) / elapsed, 1) if elapsed else None,
+        "unique_fraction": round(unique / len(puzzles), 4),
+        "grade_match_fraction": round(agreed / len(puzzles), 4),
+        "clues": {str(number): clues[number] for number in sorted(clues)},
+        "grades": {technique: techniques[technique] for technique in TECHNIQUES if techniques[technique]},
+    }
+
+
+def run_benchmark(generators=None, difficulties=None, count=20, seeds=DEFAULT_SEEDS):
+    """Benchmark the generators on the difficulties; returns the whole JSON report as a dict."""
+    generators = generators or list(GENERATORS)
+    difficulties = difficulties or list(REMOVALS)
+    for name in generators:
+        if name not in GENERATORS:
+            raise ValueError(f"Unknown generator: {name!r}")
+    for difficulty in difficulties:
+        if difficulty not in REMOVALS:
+            raise ValueError(f"Unknown difficulty {difficulty!r}; use one of {list(REMOVALS)}")
+
+    return {
+        "benchmark": "generators",
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "seeds": list(seeds),
+        "count_per_seed": count,
+        "results": {
+            name: {difficulty: bench_difficulty(GENERATORS[name], difficulty, count, seeds) for difficulty in difficulties}
+            for name in generators
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure puzzle generator throughput and quality.")
+    parser.add_argument("--generator", action="append", choices=sorted(GENERATORS), help="generator to run (repeatable, default all)")
+    parser.add_argument("--difficulty", action="append", choices=list(REMOVALS), help="difficulty to run (repeatable, default all)")
+    parser.add_argument("--count", type=int, default=20, help="puzzles per seed and difficulty")
+    parser.add_argument("--seeds", type=int, nargs="+", default=list(DEFAULT_SEEDS), help="random seeds to generate from")
+    parser.add_argument("--output", default="-", help="JSON file to write, - for stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.generator, args.difficulty, args.count, args.seeds)
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as output_file:
+            output_file.write(text + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
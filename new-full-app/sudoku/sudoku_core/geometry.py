@@ -0,0 +1,118 @@
+'''Board geometries: grid size, box shape and their precomputed lookup tables
+
+A size-N board has digits 1..N and N boxes of box_rows x box_cols cells.
+All tables are built once per geometry and shared by every board of that
+size, so no solver or validator recomputes box math per call. Most tables
+come in two forms: indexed by (row, col), and flat, indexed by the cell
+number row * size + col. The 6x6 geometry is built at import time.
+'''
+
+# Box shape (rows, cols) for every supported grid size
+BOX_SHAPES = {
+    4: (2, 2),
+    6: (2, 3),
+    8: (2, 4),
+    9: (3, 3),
+    12: (3, 4),
+    16: (4, 4),
+}
+
+
+class Geometry:
+    """Lookup tables for one grid size.
+
+    units lists every row, then every column, then every box as lists of
+    (row, col) cells; unit indexes follow that order everywhere. The
+    cell_* and *_cells tables hold the same data for flat cell numbers.
+    """
+
+    __slots__ = (
+        "size", "box_rows", "box_cols", "all_digits", "bit_count", "digit_bits",
+        "box_of", "units", "cell_units", "peers", "shade",
+        "cells", "cell_row", "cell_col", "cell_box", "cell_peers",
+        "unit_cells", "row_cells", "col_cells", "box_cells",
+    )
+
+    def __init__(self, box_rows, box_cols):
+        size = box_rows * box_cols
+        boxes_per_band = size // box_cols
+        self.size = size
+        self.box_rows = box_rows
+        self.box_cols = box_cols
+
+        # Digit n is bit 1 << n, so bits 1..size are the legal digits
+        self.all_digits = ((1 << size) - 1) << 1
+        self.bit_count = tuple(bin(mask).count("1") for mask in range(self.all_digits + 2))
+        self.digit_bits = tuple(1 << num for num in range(1, size + 1))
+
+        self.box_of = tuple(
+            tuple(row // box_rows * boxes_per_band + col // box_cols for col in range(size))
+            for row in range(size)
+        )
+        self.units = tuple(
+            [tuple((row, col) for col in range(size)) for row in range(size)]
+            + [tuple((row, col) for row in range(size)) for col in range(size)]
+            + [tuple((band + i, stack + j) for i in range(box_rows) for j in range(box_cols))
+               for band in range(0, size, box_rows) for stack in range(0, size, box_cols)]
+        )
+        self.cell_units = tuple(
+            tuple((row, size + col, 2 * size + self.box_of[row][col]) for col in range(size))
+            for row in range(size)
+        )
+        # Cells sharing a unit with each cell, the cell itself excluded
+        self.peers = tuple(
+            tuple(
+                tuple(sorted({cell for unit in self.cell_units[row][col] for cell in self.units[unit]} - {(row, col)}))
+                for col in range(size)
+            )
+            for row in range(size)
+        )
+        # Alternating 0/1 per box, for checkerboard shading in the front ends
+        self.shade = tuple(
+            tuple((row // box_rows + col // box_cols) % 2 for col in range(size))
+            for row in range(size)
+        )
+
+        # Flat tables (cell = row * size + col)
+        self.cells = size * size
+        self.cell_row = tuple(cell // size for cell in range(self.cells))
+        self.cell_col = tuple(cell % size for cell in range(self.cells))
+        self.cell_box = tuple(self.box_of[cell // size][cell % size] for cell in range(self.cells))
+        self.cell_peers = tuple(
+            tuple(row * size + col for row, col in self.peers[cell // size][cell % size])
+            for cell in range(self.cells)
+        )
+        self.unit_cells = tuple(tuple(row * size + col for row, col in unit) for unit in self.units)
+        self.row_cells = self.unit_cells[:size]
+        self.col_cells = self.unit_cells[size:2 * size]
+        self.box_cells = self.unit_cells[2 * size:]
+
+    def __repr__(self):
+        return f"Geometry({self.size}x{self.size}, boxes {self.box_rows}x{self.box_cols})"
+
+    def empty_grid(self):
+        """Return a new list-of-lists grid of zeros."""
+        return [[0] * self.size for _ in range(self.size)]
+
+
+_GEOMETRIES = {}
+
+
+def get_geometry(size):
+    """Return the shared Geometry for an N x N grid."""
+    try:
+        return _GEOMETRIES[size]
+    except KeyError:
+        pass
+    if size not in BOX_SHAPES:
+        raise ValueError(f"Unsupported grid size {size}; supported sizes are {sorted(BOX_SHAPES)}")
+    geometry = _GEOMETRIES[size] = Geometry(*BOX_SHAPES[size])
+    return geometry
+
+
+def geometry_for(grid):
+    """Return the Geometry matching a list-of-lists grid."""
+    return get_geometry(len(grid))
+
+
+DEFAULT = get_geometry(6)
@@ -0,0 +1,229 @@
+'''Technique-based difficulty grader
+
+A puzzle is solved the way a person would: at each step the easiest
+technique that makes progress is applied, then the search starts again
+from the easiest one. The grade is the hardest technique that was needed
+and the number of steps taken. Puzzles that the techniques cannot finish
+need guessing and get the top rank.
+'''
+
+from .geometry import geometry_for
+
+'''Techniques from easiest to hardest; the index is the rank'''
+TECHNIQUES = (
+    "hidden single",
+    "naked single",
+    "naked pair",
+    "hidden pair",
+    "pointing",
+    "box/line reduction",
+    "guess",
+)
+GUESS = len(TECHNIQUES) - 1
+
+
+class Grade:
+    """Result of grading one puzzle."""
+
+    __slots__ = ("rank", "steps", "solved")
+
+    def __init__(self, rank, steps, solved):
+        self.rank = rank  # Index into TECHNIQUES of the hardest technique used
+        self.steps = steps  # Number of technique applications
+        self.solved = solved  # False when the puzzle needed guessing
+
+    @property
+    def technique(self):
+        return TECHNIQUES[self.rank]
+
+    def __repr__(self):
+        return f"Grade({self.technique!r}, steps={self.steps})"
+
+
+class _Candidates:
+    __slots__ = ("geometry", "cands", "empty")
+
+    def __init__(self, grid):
+        self.geometry = geometry_for(grid)
+        values = [num for row in grid for num in row]
+        self.cands = [0 if num else self.geometry.all_digits for num in values]
+        self.empty = values.count(0)
+        for cell, num in enumerate(values):
+            if num:
+                self._eliminate_peers(cell, 1 << num)
+
+    def _eliminate_peers(self, cell, bit):
+        cands = self.cands
+        keep = ~bit
+        for peer in self.geometry.cell_peers[cell]:
+            cands[peer] &= keep
+
+    def place(self, cell, bit):
+        self.cands[cell] = 0
+        self.empty -= 1
+        self._eliminate_peers(cell, bit)
+
+
+def _hidden_single(board):
+    cands = board.cands
+    for unit in board.geometry.unit_cells:
+        once = twice = 0
+        for cell in unit:
+            mask = cands[cell]
+            twice |= once & mask
+            once |= mask
+        singles = once & ~twice
+        if singles:
+            bit = singles & -singles
+            for cell in unit:
+                if cands[cell] & bit:
+                    board.place(cell, bit)
+                    return True
+    return False
+
+
+def _naked_single(board):
+    cands = board.cands
+    for cell in range(board.geometry.cells):
+        mask = cands[cell]
+        if mask and mask & (mask - 1) == 0:
+            board.place(cell, mask)
+            return True
+    return False
+
+
+def _naked_pair(board):
+    cands = board.cands
+    bit_count = board.geometry.bit_count
+    for unit in board.geometry.unit_cells:
+        seen = {}
+        for cell in unit:
+            mask = cands[cell]
+            if bit_count[mask] == 2:
+                if mask in seen:
+                    # Two cells share the same two candidates: no one else in the unit can have them
+                    progress = False
+                    for other in unit:
+                        if other != cell and other != seen[mask] and cands[other] & mask:
+                            cands[other] &= ~mask
+                            progress = True
+                    if progress:
+                        return True
+                else:
+                    seen[mask] = cell
+    return False
+
+
+def _hidden_pair(board):
+    cands = board.cands
+    bit_count = board.geometry.bit_count
+    for unit in board.geometry.unit_cells:
+        # Cells (as a bitmask of positions in the unit) where each digit can go
+        places = {}
+        for bit in board.geometry.digit_bits:
+            spots = 0
+            for position, cell in enumerate(unit):
+                if cands[cell] & bit:
+                    spots |= 1 << position
+            if bit_count[spots] == 2:
+                if spots in places:
+                    # Two digits confined to the same two cells: those cells hold nothing else
+                    pair = places[spots] | bit
+                    progress = False
+                    for position, cell in enumerate(unit):
+                        if spots >> position & 1 and cands[cell] & ~pair:
+                            cands[cell] &= pair
+                            progress = True
+                    if progress:
+                        return True
+                else:
+                    places[spots] = bit
+    return False
+
+
+def _confine(board, units, line_of, lines):
+    # A digit whose cells in one unit all lie in one line of another kind
+    # can be removed from the rest of that line
+    cands = board.cands
+    for unit in units:
+        for bit in board.geometry.digit_bits:
+            line = -1
+            for cell in unit:
+                if cands[cell] & bit:
+                    if line == -1:
+                        line = line_of[cell]
+                    elif line != line_of[cell]:
+                        break
+            else:
+                if line == -1:
+                    continue
+                progress = False
+                for cell in lines[line]:
+                    if cell not in unit and cands[cell] & bit:
+                        cands[cell] &= ~bit
+                        progress = True
+                if progress:
+                    return True
+    return False
+
+
+def _pointing(board):
+    geometry = board.geometry
+    return (_confine(board, geometry.box_cells, geometry.cell_row, geometry.row_cells)
+            or _confine(board, geometry.box_cells, geometry.cell_col, geometry.col_cells))
+
+
+def _box_line_reduction(board):
+    geometry = board.geometry
+    return (_confine(board, geometry.row_cells, geometry.cell_box, geometry.box_cells)
+            or _confine(board, geometry.col_cells, geometry.cell_box, geometry.box_cells))
+
+
+_STEPS = (_hidden_single, _naked_single, _naked_pair, _hidden_pair, _pointing, _box_line_reduction)
+
+
+def grade_puzzle(grid):
+    """Grade the puzzle by the hardest human technique needed to solve it."""
+    board = _Candidates(grid)
+    hardest = 0
+    steps = 0
+    while board.empty:
+        for rank, step in enumerate(_STEPS):
+            if step(board):
+                hardest = max(hardest, rank)
+                steps += 1
+                break
+        else:
+            return Grade(GUESS, steps, False)
+    return Grade(hardest, steps, True)
+
+
+'''Difficulty labels'''
+# Range of hardest-technique ranks accepted for each difficulty. The ranges
+# do not overlap, and puzzles the techniques cannot finish (GUESS) match no
+# label: they need trial and error, which none of the levels promises.
+DIFFICULTY_RANKS = {
+    "Easy": (0, 0),  # Hidden singles only
+    "Medium": (1, 1),  # Needs a naked single
+    "Difficult": (2, GUESS - 1),  # Needs pairs, pointing or box/line reduction
+}
+
+
+# Sizes whose puzzles cannot reach the 6x6 ranges. Every unique 4x4 puzzle
+# falls to hidden singles, so its levels only differ in how many cells
+# are removed.
+DIFFICULTY_RANKS_BY_SIZE = {
+    4: {"Easy": (0, 0), "Medium": (0, 0), "Difficult": (0, 0)},
+}
+
+
+def difficulty_ranks(difficulty, size=6):
+    """Return the (lowest, highest) rank accepted for the difficulty on a size x size grid."""
+    return DIFFICULTY_RANKS_BY_SIZE.get(size, DIFFICULTY_RANKS)[difficulty]
+
+
+def matches_difficulty(grade, difficulty, size=6):
+    """Check if a grade is acceptable for the difficulty label."""
+    lowest, highest = difficulty_ranks(difficulty, size)
+    return lowest <= grade.rank <= highest
+
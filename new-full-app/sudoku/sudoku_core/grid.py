@@ -0,0 +1,41 @@
+'''Small list-of-lists grid helpers shared by the front ends
+
+Everything here is plain Python with no tkinter, so it can be used on a
+server or in a script as well as behind the Tk screens.
+'''
+
+from .board_state import BoardState
+from .geometry import get_geometry
+
+
+def empty_grid(size=6):
+    """Return a new size x size grid of zeros."""
+    return get_geometry(size).empty_grid()
+
+
+def copy_grid(grid):
+    """Return a copy of the grid that shares no rows with it."""
+    return [row[:] for row in grid]
+
+
+def parse_cell(text, size=6):
+    """Return the number typed in a cell, 0 for a blank cell, or None if it is not 0..size."""
+    text = text.strip()
+    if not text:
+        return 0
+    if not text.isdigit():
+        return None
+    num = int(text)
+    return num if num <= size else None
+
+
+def validate_grid(grid):
+    """Return the (row, col) cells that repeat a number in a row, column or box."""
+    return BoardState(grid).conflicts()
+
+
+def format_time(seconds):
+    """Format a number of seconds as MM:SS."""
+    minutes = int(seconds // 60)
+    seconds = int(seconds % 60)
+    return f"{minutes:02}:{seconds:02}"
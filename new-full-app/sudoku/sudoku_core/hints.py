@@ -0,0 +1,140 @@
+'''Hint engine that explains the next logically forced placement'''
+
+from .geometry import DEFAULT, geometry_for
+
+
+def unit_name(geometry, unit):
+    """Return a readable name such as "row 3" for a unit index of the geometry."""
+    kind, number = divmod(unit, geometry.size)
+    return f"{('row', 'column', 'box')[kind]} {number + 1}"
+
+
+class Hint:
+    """One suggested placement and why it is correct."""
+
+    __slots__ = ("row", "col", "num", "reason")
+
+    def __init__(self, row, col, num, reason):
+        self.row = row
+        self.col = col
+        self.num = num
+        self.reason = reason
+
+    def __repr__(self):
+        return f"Hint({self.row}, {self.col}, {self.num}, {self.reason!r})"
+
+
+class HintEngine:
+    """Candidate cache for the board on screen, updated one cell at a time.
+
+    Naked singles are kept in a set as cells change, and hidden singles
+    are only recomputed for units touched since the last hint, so asking
+    for a hint does not rescan the whole board.
+    """
+
+    __slots__ = ("geometry", "grid", "counts", "used", "cands", "naked", "hidden", "dirty")
+
+    def __init__(self, grid=None, geometry=None):
+        if geometry is None:
+            geometry = DEFAULT if grid is None else geometry_for(grid)
+        size = geometry.size
+        units = len(geometry.units)
+        self.geometry = geometry
+        self.grid = geometry.empty_grid()
+        self.counts = [[0] * (size + 1) for _ in range(units)]  # counts[unit][num]
+        self.used = [0] * units  # Bitmask of digits present in each unit
+        self.cands = [[geometry.all_digits] * size for _ in range(size)]  # 0 for filled cells
+        self.naked = set()  # Empty cells with exactly one candidate
+        self.hidden = {}  # unit -> (cell, num) of a hidden single, or None
+        self.dirty = set(range(units))  # Units whose hidden single is stale
+        if grid is not None:
+            for row in range(size):
+                for col in range(size):
+                    if grid[row][col]:
+                        self.set_cell(row, col, grid[row][col])
+
+    def candidates(self, row, col):
+        """Return the bitmask of digits that can still go in an empty cell."""
+        return self.cands[row][col]
+
+    def _refresh(self, row, col):
+        # Recompute one cell's candidates and mark its units for re-checking
+        units = self.geometry.cell_units[row][col]
+        if self.grid[row][col]:
+            mask = 0
+        else:
+            used = self.used
+            mask = self.geometry.all_digits & ~(used[units[0]] | used[units[1]] | used[units[2]])
+        if mask == self.cands[row][col]:
+            return
+        self.cands[row][col] = mask
+        if mask and mask & (mask - 1) == 0:
+            self.naked.add((row, col))
+        else:
+            self.naked.discard((row, col))
+        self.dirty.update(units)
+
+    def set_cell(self, row, col, num):
+        """Write 'num' (0 for empty) into a cell and update the affected candidates."""
+        old = self.grid[row][col]
+        if old == num:
+            return
+        for unit in self.geometry.cell_units[row][col]:
+            counts = self.counts[unit]
+            if old:
+                counts[old] -= 1
+                if counts[old] == 0:
+                    self.used[unit] &= ~(1 << old)
+            if num:
+                counts[num] += 1
+                self.used[unit] |= 1 << num
+        self.grid[row][col] = num
+
+        self._refresh(row, col)
+        for peer_row, peer_col in self.geometry.peers[row][col]:
+            self._refresh(peer_row, peer_col)
+
+    def _hidden_single(self, unit):
+        once = twice = 0
+        cells = self.geometry.units[unit]
+        for row, col in cells:
+            mask = self.cands[row][col]
+            twice |= once & mask
+            once |= mask
+        singles = once & ~twice
+        if not singles:
+            return None
+        bit = singles & -singles
+        for row, col in cells:
+            if self.cands[row][col] & bit:
+                return (row, col), bit.bit_length() - 1
+
+    def next_hint(self, solution=None):
+        """Return the next forced placement as a Hint, or None if there is none.
+
+        When 'solution' is given, forced moves that disagree with it (the
+        board already holds a mistake) are skipped, and if nothing is
+        forced the hint is read from the solution instead.
+        """
+        for row, col in sorted(self.naked):
+            num = self.cands[row][col].bit_length() - 1
+            if solution is None or solution[row][col] == num:
+                return Hint(row, col, num, f"{num} is the only digit that fits in row {row + 1}, column {col + 1}.")
+
+        for unit in self.dirty:
+            self.hidden[unit] = self._hidden_single(unit)
+        self.dirty.clear()
+        for unit in range(len(self.geometry.units)):
+            found = self.hidden[unit]
+            if found is not None:
+                (row, col), num = found
+                if solution is None or solution[row][col] == num:
+                    return Hint(row, col, num, f"{num} can only go in one cell of {unit_name(self.geometry, unit)}.")
+
+        if solution is not None:
+            size = self.geometry.size
+            for row in range(size):
+                for col in range(size):
+                    if self.grid[row][col] == 0 and solution[row][col]:
+                        return Hint(row, col, solution[row][col], "No placement is forced here; this one comes from the solution.")
+        return None
@@ -0,0 +1,34 @@
+'''The app's original 6x6 solver, kept for the solver benchmark only
+
+is_valid_move and solve_sudoku are copied unchanged from the first
+version of first_app.py, so the benchmark can compare every engine with
+the code the app started from. Nothing else should use them.
+'''
+
+
+def is_valid_move(grid, row, col, num):
+    """Check if placing 'num' at grid[row][col] is valid."""
+    for i in range(6):
+        if grid[row][i] == num or grid[i][col] == num:
+            return False
+
+    box_row, box_col = row // 2 * 2, col // 3 * 3
+    for i in range(box_row, box_row + 2):
+        for j in range(box_col, box_col + 3):
+            if grid[i][j] == num:
+                return False
+    return True
+
+def solve_sudoku(grid):
+    """Solve the Sudoku grid using backtracking."""
+    for row in range(6):
+        for col in range(6):
+            if grid[row][col] == 0:
+                for num in range(1, 7):
+                    if is_valid_move(grid, row, col, num):
+                        grid[row][col] = num
+                        if solve_sudoku(grid):
+                            return True
+                        grid[row][col] = 0
+                return False
+    return True
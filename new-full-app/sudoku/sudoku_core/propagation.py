@@ -0,0 +1,56 @@
+'''Constraint propagation run before the backtracking search'''
+
+
+def propagate(state, placed):
+    """Fill naked and hidden singles until nothing changes.
+
+    Every filled cell is appended to 'placed' so the caller can undo the
+    work. Returns False as soon as a cell or a digit runs out of options.
+    """
+    grid = state.grid
+    size = state.geometry.size
+    units = state.geometry.units
+    all_digits = state.all_digits
+    changed = True
+    while changed:
+        changed = False
+
+        # Naked singles: an empty cell with exactly one candidate
+        for row in range(size):
+            for col in range(size):
+                if grid[row][col] == 0:
+                    mask = state.candidates(row, col)
+                    if mask == 0:
+                        return False
+                    if mask & (mask - 1) == 0:
+                        state.place(row, col, mask.bit_length() - 1)
+                        placed.append((row, col))
+                        changed = True
+
+        # Hidden singles: a digit with exactly one possible cell in a unit
+        for unit in units:
+            once = twice = filled = 0
+            for row, col in unit:
+                num = grid[row][col]
+                if num != 0:
+                    filled |= 1 << num
+                else:
+                    mask = state.candidates(row, col)
+                    twice |= once & mask
+                    once |= mask
+            if (once | filled) != all_digits:
+                return False
+
+            singles = once & ~twice & ~filled
+            if not singles:
+                continue
+            for row, col in unit:
+                if grid[row][col] == 0:
+                    mask = state.candidates(row, col) & singles
+                    if mask:
+                        if mask & (mask - 1):
+                            return False  # One cell is the only home of two digits
+                        state.place(row, col, mask.bit_length() - 1)
+                        placed.append((row, col))
+                        changed = True
+    return True
@@ -0,0 +1,121 @@
+'''Pre-generated puzzle bank stored in a compact, memory-mapped binary file
+
+File layout (all integers little-endian):
+
+    header   "SDKB", version (u8), number of difficulties (u8), 2 pad bytes
+    index    one entry per difficulty: code (u8), 3 pad bytes,
+             offset of its first record (u32), record count (u32)
+    records  RECORD_SIZE bytes each, grouped by difficulty
+
+A record is a metadata byte (difficulty code in the low nibble, grader
+rank of the hardest technique in the high nibble) followed by 72 cells
+packed at 3 bits each: the 36 puzzle cells (0 = empty) and then the 36 solution
+cells, in row-major order. Drawing a puzzle is one index lookup and one
+slice of the mapped file; no solver runs.
+'''
+
+import mmap
+import os
+import random
+import struct
+
+MAGIC = b"SDKB"
+VERSION = 2
+DIFFICULTIES = ("Easy", "Medium", "Difficult")
+
+HEADER = struct.Struct("<4sBB2x")
+INDEX_ENTRY = struct.Struct("<B3xII")
+PACKED_SIZE = 27  # 72 cells x 3 bits
+RECORD_SIZE = 1 + PACKED_SIZE
+
+DEFAULT_BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "puzzles.bank")
+
+
+def pack_record(difficulty, rank, puzzle, solution):
+    """Encode one graded puzzle and its solution as a RECORD_SIZE byte string."""
+    value = 0
+    shift = 0
+    for grid in (puzzle, solution):
+        for row in grid:
+            for num in row:
+                value |= num << shift
+                shift += 3
+    return bytes((DIFFICULTIES.index(difficulty) | rank << 4,)) + value.to_bytes(PACKED_SIZE, "little")
+
+
+def unpack_record(record):
+    """Decode a record into (difficulty, rank, puzzle, solution)."""
+    value = int.from_bytes(record[1:RECORD_SIZE], "little")
+    cells = [(value >> shift) & 7 for shift in range(0, 216, 3)]
+    puzzle = [cells[i:i + 6] for i in range(0, 36, 6)]
+    solution = [cells[i:i + 6] for i in range(36, 72, 6)]
+    return DIFFICULTIES[record[0] & 0x0F], record[0] >> 4, puzzle, solution
+
+
+def write_bank(path, puzzles):
+    """Write a bank file from {difficulty: [(rank, puzzle, solution), ...]}."""
+    levels = [difficulty for difficulty in DIFFICULTIES if puzzles.get(difficulty)]
+    offset = HEADER.size + INDEX_ENTRY.size * len(levels)
+
+    index = []
+    for difficulty in levels:
+        index.append(INDEX_ENTRY.pack(DIFFICULTIES.index(difficulty), offset, len(puzzles[difficulty])))
+        offset += RECORD_SIZE * len(puzzles[difficulty])
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as bank_file:
+        bank_file.write(HEADER.pack(MAGIC, VERSION, len(levels)))
+        bank_file.write(b"".join(index))
+        for difficulty in levels:
+            for rank, puzzle, solution in puzzles[difficulty]:
+                bank_file.write(pack_record(difficulty, rank, puzzle, solution))
+
+
+class PuzzleBank:
+    """Read-only view of a bank file mapped into memory."""
+
+    def __init__(self, path=DEFAULT_BANK_PATH):
+        with open(path, "rb") as bank_file:
+            self._data = mmap.mmap(bank_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, levels = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            self._data.close()
+            raise ValueError(f"{path} is not a version {VERSION} puzzle bank")
+
+        # difficulty -> (offset of first record, record count)
+        self._index = {}
+        for i in range(levels):
+            code, offset, count = INDEX_ENTRY.unpack_from(self._data, HEADER.size + i * INDEX_ENTRY.size)
+            self._index[DIFFICULTIES[code]] = (offset, count)
+
+    def count(self, difficulty):
+        """Return how many puzzles the bank holds for the difficulty."""
+        return self._index.get(difficulty, (0, 0))[1]
+
+    def record(self, difficulty, position):
+        """Return (difficulty, rank, puzzle, solution) for the record at 'position'."""
+        offset, count = self._index[difficulty]
+        if not 0 <= position < count:
+            raise IndexError(f"{difficulty} has {count} puzzles, asked for #{position}")
+        start = offset + position * RECORD_SIZE
+        return unpack_record(self._data[start:start + RECORD_SIZE])
+
+    def get(self, difficulty, position):
+        """Return (puzzle, solution) for the record at 'position' of the difficulty."""
+        return self.record(difficulty, position)[2:]
+
+    def draw(self, difficulty, rng=random):
+        """Return a random (puzzle, solution) of the difficulty."""
+        return self.get(difficulty, rng.randrange(self.count(difficulty)))
+
+    def close(self):
+        self._data.close()
+
+
+def open_bank(path=DEFAULT_BANK_PATH):
+    """Open the bank at 'path', or return None when there is no usable bank."""
+    try:
+        return PuzzleBank(path)
+    except (OSError, ValueError, struct.error):
+        return None
@@ -0,0 +1,183 @@
+'''Solver benchmark over the reference puzzle corpus
+
+Usage (from the directory holding sudoku_core):
+
+    python -m sudoku_core.solver_benchmark --repeat 5 --output solvers.json
+
+Every engine in ENGINES solves every puzzle of data/bench_puzzles.txt
+'repeat' times. For each engine and puzzle set the JSON report holds the
+median, p95 and p99 solve time, the search nodes visited and the peak
+memory allocated during a solve. ENGINES holds SOLVERS plus "original",
+an unchanged copy of the solve_sudoku the app started with, which is
+marked as the baseline. Engines run without presolve unless --presolve
+is given, so the numbers are the search alone.
+'''
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from . import original_solver
+from .board import Board
+from .board_state import BoardState
+from .propagation import propagate
+from .solvers import SOLVERS, SolveStats, solve
+
+DEFAULT_CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "bench_puzzles.txt")
+BASELINE_ENGINE = "original"
+ENGINES = (BASELINE_ENGINE, *SOLVERS)
+
+
+def solve_original(grid, stats=None, presolve=False):
+    """Solve the grid in place with the original solve_sudoku, taking the same options as solve()."""
+    if presolve and not propagate(BoardState(grid), []):
+        return False
+    if stats is None:
+        return original_solver.solve_sudoku(grid)
+
+    # Every call of solve_sudoku is a search node. Its recursion looks the
+    # name up in its module, so a counting wrapper stands in during the solve.
+    original = original_solver.solve_sudoku
+
+    def counted(grid):
+        stats.nodes += 1
+        return original(grid)
+
+    original_solver.solve_sudoku = counted
+    try:
+        return counted(grid)
+    finally:
+        original_solver.solve_sudoku = original
+
+
+def _solve(grid, engine, stats=None, presolve=False):
+    if engine == BASELINE_ENGINE:
+        return solve_original(grid, stats, presolve)
+    return solve(grid, engine, stats, presolve)
+
+
+def load_corpus(path=DEFAULT_CORPUS_PATH):
+    """Return {set name: [grid, ...]} from a corpus file, in file order."""
+    corpus = {}
+    with open(path) as corpus_file:
+        for line in corpus_file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, cells = line.split()
+            corpus.setdefault(name, []).append(Board.from_string(cells).to_grid())
+    return corpus
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of a non-empty list, e.g. fraction=0.95 for p95."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def bench_set(engine, grids, repeat=5, presolve=False):
+    """Benchmark one engine on one puzzle set; returns the report entry as a dict."""
+    # Nodes come from a counted solve, which also warms up the engine
+    nodes = []
+    solved = 0
+    for grid in grids:
+        stats = SolveStats()
+        solved += _solve([row[:] for row in grid], engine, stats, presolve)
+        nodes.append(stats.nodes)
+
+    # Timed solves run without stats, so node counting does not add to them
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for grid in grids:
+            for _ in range(repeat):
+                work = [row[:] for row in grid]
+                start = time.perf_counter()
+                _solve(work, engine, presolve=presolve)
+                times.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    # Memory gets its own pass: tracemalloc slows down everything it watches
+    peak = 0
+    tracemalloc.start()
+    try:
+        for grid in grids:
+            work = [row[:] for row in grid]
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            _solve(work, engine, presolve=presolve)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "puzzles": len(grids),
+        "solved": solved,
+        "runs": len(times),
+        "median_us": round(percentile(times, 0.5) * 1e6, 1),
+        "p95_us": round(percentile(times, 0.95) * 1e6, 1),
+        "p99_us": round(percentile(times, 0.99) * 1e6, 1),
+        "nodes_median": percentile(nodes, 0.5),
+        "nodes_max": max(nodes),
+        "nodes_total": sum(nodes),
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmark(engines=None, sets=None, repeat=5, presolve=False, corpus_path=DEFAULT_CORPUS_PATH):
+    """Benchmark the engines on the corpus sets; returns the whole JSON report as a dict."""
+    corpus = load_corpus(corpus_path)
+    engines = engines or list(ENGINES)
+    sets = sets or list(corpus)
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown solver engine: {engine!r}")
+    for name in sets:
+        if name not in corpus:
+            raise ValueError(f"Unknown puzzle set {name!r}; the corpus has {sorted(corpus)}")
+
+    return {
+        "benchmark": "solvers",
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "corpus": os.path.basename(corpus_path),
+        "repeat": repeat,
+        "presolve": presolve,
+        "baseline": BASELINE_ENGINE,
+        "results": {
+            engine: {name: bench_set(engine, corpus[name], repeat, presolve) for name in sets}
+            for engine in engines
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the solver engines on the reference puzzle corpus.")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES), help="engine to run (repeatable, default all)")
+    parser.add_argument("--set", action="append", dest="sets", help="puzzle set to run (repeatable, default all)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed solves per puzzle")
+    parser.add_argument("--presolve", action="store_true", help="fill singles by propagation before the search")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_PATH, help="corpus file to read")
+    parser.add_argument("--output", default="-", help="JSON file to write, - for stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.engine, args.sets, args.repeat, args.presolve, args.corpus)
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as output_file:
+            output_file.write(text + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+'''Solver engines for N x N grids
+
+Every engine takes a list-of-lists grid, fills it in place and returns
+True when a solution was found, just like the original solve_sudoku.
+Engines also take an optional threading.Event; the search checks it at
+every node and raises SolveCancelled once it is set.
+'''
+
+from .board_state import BoardState, digits_in
+from .dlx import ExactCover, solve_dlx
+from .errors import SolveCancelled
+from .propagation import propagate
+
+
+class SolveStats:
+    """Counts how the empty cells of one solve were filled."""
+
+    __slots__ = ("propagated", "searched", "nodes")
+
+    def __init__(self):
+        self.propagated = 0  # Cells filled by naked/hidden singles
+        self.searched = 0  # Cells filled by the backtracking engine
+        self.nodes = 0  # Search nodes the engine visited, also counted for unsolvable grids
+
+    def __repr__(self):
+        return f"SolveStats(propagated={self.propagated}, searched={self.searched}, nodes={self.nodes})"
+
+
+class _NodeCounter:
+    # Stands in for the cancel event: every engine calls is_set() once per search node
+    __slots__ = ("cancel", "nodes")
+
+    def __init__(self, cancel):
+        self.cancel = cancel
+        self.nodes = 0
+
+    def is_set(self):
+        self.nodes += 1
+        return self.cancel is not None and self.cancel.is_set()
+
+
+def solve_backtracking(grid, cancel=None):
+    """Solve the Sudoku grid using row-major backtracking."""
+    state = BoardState(grid)
+    if state.has_duplicates():
+        return False  # Repeated givens would otherwise be "solved" around
+    return _search_backtracking(state, 0, cancel)
+
+
+def _search_backtracking(state, start, cancel):
+    # Cells before 'start' are already filled on this branch
+    if cancel is not None and cancel.is_set():
+        raise SolveCancelled
+    grid = state.grid
+    geometry = state.geometry
+    cell_row, cell_col = geometry.cell_row, geometry.cell_col
+    for cell in range(start, geometry.cells):
+        row, col = cell_row[cell], cell_col[cell]
+        if grid[row][col] == 0:
+            for num in digits_in(state.candidates(row, col)):
+                state.place(row, col, num)
+                if _search_backtracking(state, cell + 1, cancel):
+                    return True
+                state.unplace(row, col)
+            return False
+    return True
+
+
+def solve_mrv(grid, cancel=None):
+    """Solve the Sudoku grid, always branching on the cell with the fewest candidates."""
+    state = BoardState(grid)
+    if state.has_duplicates():
+        return False  # Repeated givens would otherwise be "solved" around
+    geometry = state.geometry
+    empties = [cell for cell in range(geometry.cells) if grid[geometry.cell_row[cell]][geometry.cell_col[cell]] == 0]
+    return _search_mrv(state, empties, len(empties), cancel)
+
+
+def _search_mrv(state, empties, remaining, cancel):
+    # empties[:remaining] holds the flat cell numbers not yet filled on this branch
+    if remaining == 0:
+        return True
+    if cancel is not None and cancel.is_set():
+        raise SolveCancelled
+
+    geometry = state.geometry
+    bit_count = geometry.bit_count
+    cell_row, cell_col, cell_box = geometry.cell_row, geometry.cell_col, geometry.cell_box
+    rows, cols, boxes = state.rows, state.cols, state.boxes
+    all_digits = state.all_digits
+    best = 0
+    best_mask = 0
+    best_count = geometry.size + 1
+    for i in range(remaining):
+        cell = empties[i]
+        mask = all_digits & ~(rows[cell_row[cell]] | cols[cell_col[cell]] | boxes[cell_box[cell]])
+        count = bit_count[mask]
+        if count < best_count:
+            if count == 0:
+                return False
+            best, best_mask, best_count = i, mask, count
+            if count == 1:
+                break
+
+    # Move the chosen cell out of the unvisited prefix
+    last = remaining - 1
+    empties[best], empties[last] = empties[last], empties[best]
+    cell = empties[last]
+    row, col = cell_row[cell], cell_col[cell]
+    for num in digits_in(best_mask):
+        state.place(row, col, num)
+        if _search_mrv(state, empties, last, cancel):
+            return True
+        state.unplace(row, col)
+    return False
+
+
+'''Engine registry'''
+SOLVERS = {
+    "backtracking": solve_backtracking,
+    "mrv": solve_mrv,
+    "dlx": solve_dlx,
+}
+
+DEFAULT_ENGINE = "mrv"
+
+
+def solve(grid, engine=DEFAULT_ENGINE, stats=None, presolve=True, cancel=None):
+    """Solve the grid in place with the named engine.
+
+    With 'presolve' the singles found by constraint propagation are filled
+    first and the engine only searches what is left. Pass a SolveStats to
+    see how many cells each stage filled and how many search nodes the
+    engine visited. When the 'cancel' event is set
+    mid-search, the grid is restored and SolveCancelled is raised.
+    """
+    try:
+        solver = SOLVERS[engine]
+    except KeyError:
+        raise ValueError(f"Unknown solver engine: {engine!r}") from None
+
+    placed = []
+    if presolve:
+        state = BoardState(grid)
+        if not propagate(state, placed):
+            _undo(state, placed)
+            return False
+
+    empty_before = sum(row.count(0) for row in grid)
+    # Only a cancellable solve can stop half way, so only it keeps a copy to restore
+    original = [row[:] for row in grid] if cancel is not None else None
+    counter = _NodeCounter(cancel) if stats is not None else None
+    try:
+        solved = solver(grid, cancel if counter is None else counter)
+    except SolveCancelled:
+        for row, line in zip(grid, original):
+            row[:] = line
+        _undo(BoardState(grid), placed)
+        raise
+    if stats is not None:
+        stats.nodes = counter.nodes
+    if not solved:
+        if placed:
+            _undo(BoardState(grid), placed)
+        return False
+
+    if stats is not None:
+        stats.propagated = len(placed)
+        stats.searched = empty_before
+    return True
+
+
+def _undo(state, placed):
+    for row, col in reversed(placed):
+        state.unplace(row, col)
+
+
+def count_solutions(grid, limit=2):
+    """Count the solutions of the grid, stopping as soon as 'limit' are found.
+
+    With the default limit of 2 this is a uniqueness check: 0 means no
+    solution, 1 means unique, 2 means ambiguous. Pass limit=None to count
+    them all. The grid is left untouched.
+    """
+    count = 0
+    for _ in ExactCover(grid).search():
+        count += 1
+        if count == limit:
+            break
+    return count
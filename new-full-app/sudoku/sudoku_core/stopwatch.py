@@ -0,0 +1,52 @@
+'''Game timer on the monotonic clock
+
+time.time() follows the wall clock, so the game time jumped whenever the
+clock was set or synced. A Stopwatch adds up running spans measured with
+time.monotonic() instead, and tells the UI how long to wait until the
+shown whole second changes, so the label is touched once a second.
+'''
+
+import time
+
+
+class Stopwatch:
+    """Pausable elapsed-time counter; elapsed() is the time spent running."""
+
+    __slots__ = ("clock", "_elapsed", "_started")
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock  # Any monotonic clock returning seconds
+        self._elapsed = 0.0  # Total of the finished running spans
+        self._started = None  # Clock reading when the current span began, None while paused
+
+    @property
+    def running(self):
+        return self._started is not None
+
+    def elapsed(self):
+        """Return the seconds spent running, including the current span."""
+        if self._started is None:
+            return self._elapsed
+        return self._elapsed + self.clock() - self._started
+
+    def start(self):
+        """Start or resume counting; does nothing if already running."""
+        if self._started is None:
+            self._started = self.clock()
+
+    resume = start
+
+    def pause(self):
+        """Stop counting and keep the time so far; does nothing if already paused."""
+        if self._started is not None:
+            self._elapsed += self.clock() - self._started
+            self._started = None
+
+    def reset(self):
+        """Stop and go back to zero."""
+        self._elapsed = 0.0
+        self._started = None
+
+    def until_next_second(self):
+        """Return the seconds until elapsed() reaches the next whole second."""
+        return 1.0 - self.elapsed() % 1.0
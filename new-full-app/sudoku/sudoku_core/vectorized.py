@@ -0,0 +1,72 @@
+'''NumPy batch validator for many N x N grids at once
+
+This module needs numpy, which the Tk front ends do not, so it is not
+imported by the package __init__. Use it directly:
+
+    from sudoku_core.vectorized import validate_many
+'''
+
+import numpy as np
+
+from .geometry import get_geometry
+
+
+def _duplicates(units, all_digits):
+    # units has shape (N, unit, cell); returns the digit bits seen twice per unit
+    once = np.zeros(units.shape[:2], dtype=units.dtype)
+    twice = np.zeros_like(once)
+    for cell in range(units.shape[2]):
+        bits = units[:, :, cell]
+        twice |= once & bits
+        once |= bits
+    return twice & all_digits
+
+
+def _validate_chunk(grids, geometry):
+    count = len(grids)
+    size, box_rows, box_cols = geometry.size, geometry.box_rows, geometry.box_cols
+    bands, stacks = size // box_rows, size // box_cols
+    # Same encoding as BoardState: digit n is bit 1 << n, so a uint8 holds sizes below 8
+    dtype = np.uint8 if size < 8 else np.uint32
+    all_digits = dtype(geometry.all_digits)
+    # Empty cells become bit 0, which is masked out; out-of-range digits are caught below
+    bits = np.left_shift(dtype(1), np.minimum(grids, size + 1).astype(dtype))
+
+    row_dups = _duplicates(bits, all_digits)
+    col_dups = _duplicates(bits.transpose(0, 2, 1), all_digits)
+    boxes = bits.reshape(count, bands, box_rows, stacks, box_cols).transpose(0, 1, 3, 2, 4).reshape(count, size, size)
+    box_dups = _duplicates(boxes, all_digits).reshape(count, bands, stacks)
+
+    # Spread each unit's repeated digits back over its cells
+    dups = row_dups[:, :, None] | col_dups[:, None, :]
+    dups |= box_dups.repeat(box_rows, axis=1).repeat(box_cols, axis=2)
+
+    conflicts = (bits & dups) != 0
+    in_range = (grids <= size).all(axis=(1, 2))
+    valid = in_range & ~conflicts.any(axis=(1, 2))
+    return valid, conflicts
+
+
+def validate_many(grids, chunk_size=65536):
+    """Validate an (N, n, n) array of grids, for any supported size n.
+
+    Returns (valid, conflicts): 'valid' is a bool array of shape (N,) that
+    is True when a grid has only digits 0-n and no digit repeats in a row,
+    column or box; 'conflicts' is a bool array of shape (N, n, n) marking
+    the cells that take part in a repeat, like validate_grid. Empty cells
+    (0) are allowed. Grids are processed 'chunk_size' at a time to bound
+    the temporary arrays.
+    """
+    grids = np.asarray(grids, dtype=np.uint8)
+    if grids.ndim == 2:
+        grids = grids[None]
+    if grids.ndim != 3 or grids.shape[1] != grids.shape[2]:
+        raise ValueError(f"Expected grids of shape (N, n, n), got {grids.shape}")
+    geometry = get_geometry(grids.shape[1])
+
+    valid = np.empty(len(grids), dtype=bool)
+    conflicts = np.empty(grids.shape, dtype=bool)
+    for start in range(0, len(grids), chunk_size):
+        stop = start + chunk_size
+        valid[start:stop], conflicts[start:stop] = _validate_chunk(grids[start:stop], geometry)
+    return valid, conflicts
@@ -0,0 +1,11 @@
+'''Tk rendering helpers shared by the screens'''
+
+from .canvas_grid import CanvasGrid
+from .entry_grid import EntryGrid
+from .shadow import ShadowGrid
+
+'''Grid renderers by name, for the screens' GRID_RENDERER setting'''
+GRID_RENDERERS = {
+    "entry": EntryGrid,  # One tk.Entry per cell
+    "canvas": CanvasGrid,  # One tk.Canvas for the whole grid
+}
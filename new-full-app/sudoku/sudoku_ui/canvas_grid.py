@@ -0,0 +1,125 @@
+'''Whole grid drawn on one tk.Canvas
+
+An EntryGrid needs one widget per cell, so a 16x16 board means 256
+entries, each with its own font, colours and validation. A CanvasGrid
+draws every cell as a rectangle and a text item on a single canvas and
+handles the mouse and keyboard itself. flush() only reconfigures the
+items of cells that changed, so Tk repaints just their rectangles.
+
+It takes the same arguments and Entry-style options as EntryGrid, so a
+screen can use either one.
+'''
+
+import tkinter as tk
+
+from .shadow import ShadowGrid
+
+GAP = 4  # Space between cells, where the grid colour shows through
+DISABLED_FG = "#A3A3A3"  # Tk's default disabledforeground for entries
+SELECTED_OUTLINE = "#4A90E2"
+
+
+class CanvasGrid(ShadowGrid, tk.Canvas):
+    """Every cell of the grid drawn as canvas items; click a cell and type to edit it."""
+
+    def __init__(self, master, backgrounds, font, fg=None, grid_color="#E2E8F0", on_edit=None, validate=None, cell_size=None):
+        size = len(backgrounds)
+        if cell_size is None:
+            cell_size = max(24, min(50, 456 // size))  # 6x6 matches the entry grid, 16x16 still fits the window
+        family, points, *style = font
+        font = (family, max(8, points * cell_size // 50), *style)
+        extent = size * (cell_size + GAP) + GAP
+        tk.Canvas.__init__(self, master, width=extent, height=extent, bg=grid_color,
+                           highlightthickness=0, takefocus=1)
+        self._init_shadow(backgrounds, on_edit)
+        self.cell_size = cell_size
+        self.fg = fg or "black"
+        self.validate = validate
+        self.selected = None  # (row, col) of the cell that takes key presses
+
+        self.rects = []
+        self.labels = []
+        for row in range(size):
+            row_rects = []
+            row_labels = []
+            for col in range(size):
+                x0, y0 = self._origin(row, col)
+                row_rects.append(self.create_rectangle(x0, y0, x0 + cell_size, y0 + cell_size,
+                                                       fill=backgrounds[row][col], width=0))
+                row_labels.append(self.create_text(x0 + cell_size // 2, y0 + cell_size // 2,
+                                                   text="", font=font, fill=self.fg))
+            self.rects.append(row_rects)
+            self.labels.append(row_labels)
+
+        self.bind("<Button-1>", self.on_click)
+        self.bind("<Key>", self.on_key)
+
+    def _origin(self, row, col):
+        step = self.cell_size + GAP
+        return GAP + col * step, GAP + row * step
+
+    def cell_at(self, x, y):
+        """Return the (row, col) under a canvas point, or None between cells."""
+        step = self.cell_size + GAP
+        col, x_off = divmod(x - GAP, step)
+        row, y_off = divmod(y - GAP, step)
+        if 0 <= row < self.board_size and 0 <= col < self.board_size and x_off < self.cell_size and y_off < self.cell_size:
+            return row, col
+        return None
+
+    '''Drawing'''
+    def _show_options(self, row, col, changed):
+        options = self.options[row][col]  # Already updated with 'changed'
+        state = options.get("state", "normal")
+        if state == "disabled":
+            fill = options.get("disabledbackground") or options.get("bg")
+            text_fill = options.get("disabledforeground") or DISABLED_FG
+        else:
+            fill = options.get("bg")
+            text_fill = self.fg
+        self.itemconfigure(self.rects[row][col], fill=fill)
+        self.itemconfigure(self.labels[row][col], fill=text_fill)
+
+    def _show_text(self, row, col, text):
+        self.itemconfigure(self.labels[row][col], text=text)
+        self._typed(row, col, text)
+
+    def select(self, cell):
+        """Move the key focus to a cell, outlining it."""
+        if self.selected is not None:
+            self.itemconfigure(self.rects[self.selected[0]][self.selected[1]], width=0)
+        self.selected = cell
+        if cell is not None:
+            self.itemconfigure(self.rects[cell[0]][cell[1]], width=2, outline=SELECTED_OUTLINE)
+
+    '''Input'''
+    def on_click(self, event):
+        self.focus_set()
+        self.select(self.cell_at(event.x, event.y))
+
+    def on_key(self, event):
+        moves = {"Up": (-1, 0), "Down": (1, 0), "Left": (0, -1), "Right": (0, 1)}
+        if self.selected is None:
+            return
+        row, col = self.selected
+        if event.keysym in moves:
+            d_row, d_col = moves[event.keysym]
+            self.select(((row + d_row) % self.board_size, (col + d_col) % self.board_size))
+            return "break"
+        if self.options[row][col].get("state", "normal") != "normal":
+            return  # Disabled and read-only cells cannot be typed in, as with entries
+
+        text = self.texts[row][col]
+        if event.keysym in ("BackSpace", "Delete"):
+            text = text[:-1]
+        elif event.char.isdigit():
+            # Numbers above 9 take two key presses; a press that cannot extend the number starts a new one
+            longer = text + event.char
+            text = longer if len(longer) <= len(str(self.board_size)) and int(longer) <= self.board_size else event.char
+        else:
+            return
+        if self.validate is not None and not self.validate(text):
+            return "break"
+        self.set(row, col, text=text)
+        self.flush()
+        return "break"
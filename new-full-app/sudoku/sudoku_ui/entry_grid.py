@@ -0,0 +1,48 @@
+'''Grid of tk.Entry cells drawn through a shadow state
+
+Every changed cell costs at most one configure() and one text write.
+Cell text goes through the entry's StringVar, which works whatever the
+state of the entry is, so a disabled cell never has to be enabled just to
+change its number.
+'''
+
+import tkinter as tk
+
+from .shadow import ShadowGrid
+
+
+class EntryGrid(ShadowGrid, tk.Frame):
+    """One tk.Entry per cell, inside a frame that shows the grid lines."""
+
+    def __init__(self, master, backgrounds, font, fg=None, grid_color="#E2E8F0", on_edit=None, validate=None):
+        tk.Frame.__init__(self, master, bg=grid_color, bd=2, relief="flat")
+        self._init_shadow(backgrounds, on_edit)
+        size = self.board_size
+
+        entry_options = {"width": 2, "font": font, "justify": "center", "relief": "flat"}
+        if fg is not None:
+            entry_options["fg"] = fg
+        if validate is not None:
+            # Key validation: 'validate' gets the text the entry would hold after the key
+            entry_options.update(validate="key", validatecommand=(self.register(validate), "%P"))
+
+        self.entries = []
+        self.variables = []  # One StringVar per entry, traced to keep the shadow text right
+        for row in range(size):
+            row_entries = []
+            row_vars = []
+            for col in range(size):
+                cell_var = tk.StringVar(self)
+                cell_var.trace_add("write", lambda *args, row=row, col=col, var=cell_var: self._typed(row, col, var.get()))
+                entry = tk.Entry(self, bg=backgrounds[row][col], textvariable=cell_var, **entry_options)
+                entry.grid(row=row, column=col, ipadx=10, ipady=10, padx=2, pady=2)
+                row_entries.append(entry)
+                row_vars.append(cell_var)
+            self.entries.append(row_entries)
+            self.variables.append(row_vars)
+
+    def _show_options(self, row, col, changed):
+        self.entries[row][col].config(**changed)
+
+    def _show_text(self, row, col, text):
+        self.variables[row][col].set(text)  # The trace updates the shadow and runs on_edit
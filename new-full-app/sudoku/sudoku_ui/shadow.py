@@ -0,0 +1,68 @@
+'''Shadow state shared by the grid renderers
+
+Redrawing a grid one cell at a time costs several Tk commands per cell,
+and each one is a round trip when the display is remote. A grid view
+remembers what every cell shows right now: its text and the options it
+was last configured with. Screens describe the state they want with
+set(), and flush() sends only the differences.
+'''
+
+
+class ShadowGrid:
+    """Mixin for grid widgets that keeps a shadow copy of every cell.
+
+    Subclasses call _init_shadow() and implement _show_options() and
+    _show_text(); they call _typed() whenever the text of a cell changes,
+    which keeps the shadow right and runs the on_edit callback.
+    """
+
+    def _init_shadow(self, backgrounds, on_edit):
+        size = len(backgrounds)
+        self.board_size = size
+        self.on_edit = on_edit  # on_edit(row, col) after the text of a cell changes, typed or set
+        self.texts = [[""] * size for _ in range(size)]
+        self.options = [[{"state": "normal", "bg": backgrounds[row][col]} for col in range(size)]
+                        for row in range(size)]
+        self._pending = {}  # (row, col) -> (text or None, options) still to be shown
+
+    def _typed(self, row, col, text):
+        self.texts[row][col] = text
+        if self.on_edit is not None:
+            self.on_edit(row, col)
+
+    def get_text(self, row, col):
+        """Return the text a cell shows, without asking Tk."""
+        return self.texts[row][col]
+
+    def set(self, row, col, text=None, **options):
+        """Ask for a cell to show 'text' (None keeps it) and the given Entry options on the next flush().
+
+        The options are the tk.Entry ones: state, bg, disabledbackground
+        and disabledforeground.
+        """
+        old_text, old_options = self._pending.get((row, col), (None, {}))
+        if text is None:
+            text = old_text
+        self._pending[row, col] = (None if text is None else str(text), {**old_options, **options})
+
+    def flush(self):
+        """Send every pending change that differs from what is on screen."""
+        pending, self._pending = self._pending, {}
+
+        # Options first, text second: writing text runs on_edit, and
+        # whatever it recolours must not be overwritten by this batch
+        for (row, col), (text, options) in pending.items():
+            shown = self.options[row][col]
+            changed = {name: value for name, value in options.items() if shown.get(name) != value}
+            if changed:
+                shown.update(changed)
+                self._show_options(row, col, changed)
+        for (row, col), (text, options) in pending.items():
+            if text is not None and text != self.texts[row][col]:
+                self._show_text(row, col, text)
+
+    def _show_options(self, row, col, changed):
+        raise NotImplementedError
+
+    def _show_text(self, row, col, text):
+        raise NotImplementedError